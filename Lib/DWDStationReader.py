@@ -11,20 +11,39 @@ Used to read the data of DWD stations (latitude and longitude) from the correspo
 of the DWD (German Weather Service).
 """
 import os
+import mmap
 import zipfile
+import shutil
 import re
+import tempfile
 
 import Lib.GeneralFunctions as gFunc
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import List
+from pathlib import Path
+from typing import List, Tuple, Container
+from itertools import repeat
+from concurrent.futures import ThreadPoolExecutor
+from numpy.typing import NDArray
 from pandas import DataFrame
+from scipy.spatial import cKDTree
 from Lib.IOConsts import *
 from tqdm import tqdm
 from colorama import Fore, Style
 
 
+# Station ID, parameters, first and last date of a DWD station file
+_FileInfo = Tuple[int, List[str], datetime | None, datetime | None]
+# Coordinates of the DWD stations have 4 decimal places, they are stored as integer keys in units of 1e-4 degree
+_LOCATION_SCALE: int = 10000
+# Line of a DWD station initialization file: ID, start date, end date, height, latitude, longitude, name
+_INIT_LINE_PATTERN = re.compile(r"^[ \t]*(\d+) (\d+) (\d+)[ \t]+(-?\d+)[ \t]+([\d.]+)[ \t]+([\d.]+)[ \t]+(.*)$",
+                                re.MULTILINE)
+# marker of the data files in the DWD archives, the names are compared case-insensitive
+_DATA_FILE_MARKER_LOWER: str = DATA_FILE_MARKER.lower()
+
+
 class CorruptedInitFileError(Exception):
     """
     A custom exception to indicate that an initialization file is corrupted. This exception is raised when
@@ -47,6 +66,9 @@ class DWDStations:
 
     Functions:
         `get_values(...)`: is used to read out the parameter values for a specific latitude and longitude
+        `get_values_many(...)`: is used to read out the parameter values for several latitudes and longitudes at once
+        `get_nearest_stations(...)`: is used to find the nearest loaded station for any latitude and longitude
+        `load_values()`: is used to read the values of all loaded stations into memory at once
     """
 
     def __init__(self):
@@ -64,19 +86,38 @@ class DWDStations:
             COL_DWD_LOADED: "bool",
         }
         self.df: DataFrame = DataFrame(columns=columns).astype(datatypes)
-
-    def load_folder(self, path: str):
+        # content of the already read DWD files, every file is only parsed once
+        self._file_dfs: dict[str, DataFrame] = {}
+        # modification time and size of the already read DWD files, see `gFunc.get_file_stamp`
+        self._file_stamps: dict[str, Tuple[int, int]] = {}
+        # row labels of each station ID in `df`, created with the init files and extended by `_load_file`
+        self._station_rows: dict[int, List[int]] = {}
+        # rows added by `_load_file` with their row labels, appended to `df` at once by `_append_new_rows`
+        self._new_rows: dict[int, dict] = {}
+        # rows of each station with the key of its location (see `_location_key`), created after loading a folder
+        self._stations: dict[Tuple[int, int], DataFrame] = {}
+        # all loaded parameters, created after loading a folder
+        self._params: List[str] = []
+        # spatial index of the locations of all loaded stations, created after loading a folder
+        self._tree: cKDTree | None = None
+        self._tree_locations: NDArray = np.empty((0, 2))
+
+    def load_folder(self, path: str, exact_dates: bool = True):
         """
         Loads all DWD station data from text files located in a specified directory. This method performs several
         operations: it checks the existence of the directory, reads initialization files, extracts archives, and
         loads data from .txt files not marked as initialization files.
 
         :param path: A string representing the directory path from which to load the data.
+        :param exact_dates: Boolean flag to indicate whether the first and last hour of each data file is read.
+                            Defaults to True. If False, the recording period (day resolution) of the init file is kept
+                            and only the header of each data file is read.
 
         :raises FileNotFoundError: If the specified directory does not exist or contains no relevant .txt files.
 
         Note:
         The method assumes the presence of an 'init' file that must not be loaded with the regular station data.
+        After loading, the column `COL_PARAM` has the dtype 'category'.
         Each valid text file is processed to extract data, which is then sorted by station ID and parameter name.
         Progress through the files is visually tracked using a progress bar (tqdm), enhancing usability during large
         data loads.
@@ -89,16 +130,48 @@ class DWDStations:
         """
         if not os.path.exists(path):
             raise FileNotFoundError(f"Folder: '{path}' not exist.")
-        extract_dwd_archives(path)
-        dwd_txt_files = gFunc.get_files(path, ".txt")
+        # walk the folder only once for archives and text files
+        files = gFunc.get_files_by_extensions(path, [".zip", ".txt"])
+        dwd_txt_files = files[".txt"] + extract_dwd_archives(path, files[".zip"])
+        # files may have been replaced since the last request - keep only the content of unchanged files
+        self._file_dfs = {filename: df_file for filename, df_file in self._file_dfs.items()
+                          if gFunc.get_file_stamp(filename) == self._file_stamps.get(filename)}
         # nothing or only the init file
         if len(dwd_txt_files) == 0:
             raise FileNotFoundError(f"No DWD *.txt Files exist in '{path}'")
-        self._read_init_files(path)
-        for dwd_txt in tqdm(dwd_txt_files, total=len(dwd_txt_files), desc="Loading DWD-Files"):
-            if INIT_FILE_HOURLY_MARKER not in os.path.basename(dwd_txt):
-                self._load_file(dwd_txt)
+        # the params of the stations are changed while loading, new params are no categories yet
+        self.df[COL_PARAM] = self.df[COL_PARAM].astype(object)
+        # split the listing into init and data files in one pass
+        init_files: List[str] = []
+        data_files: List[str] = []
+        for dwd_txt in dwd_txt_files:
+            (init_files if _is_init_file(dwd_txt) else data_files).append(dwd_txt)
+        self._read_init_files(path, init_files)
+        # read the files in parallel threads (I/O bound), the DataFrame is only changed by this thread
+        with ThreadPoolExecutor(max_workers=min(32, max(1, len(data_files)))) as executor:
+            file_infos = list(tqdm(executor.map(_read_file_info, data_files, repeat(self._station_rows.keys()),
+                                                repeat(exact_dates)),
+                                   total=len(data_files), desc="Loading DWD-Files"))
+        warnings: List[str] = []
+        for dwd_txt, file_info in zip(data_files, file_infos):
+            self._load_file(dwd_txt, warnings, file_info)
+        self._append_new_rows()
+        # show all warnings with one output after the progress bar
+        if warnings:
+            print(Fore.YELLOW + "\n" + "\n".join(warnings) + Style.RESET_ALL)
         self.df.sort_values(by=[COL_STATION_ID, COL_PARAM], inplace=True)
+        # only a few different params - store each only once and compare them as integer codes
+        self.df[COL_PARAM] = self.df[COL_PARAM].astype("category")
+        # Ignore empty param
+        self._params = [param for param in self.df[COL_PARAM].unique().tolist() if param.strip()]
+        self._stations = {_location_key(*location): rows
+                          for location, rows in self.df.groupby([COL_LAT, COL_LON], sort=False)}
+        loaded_locations = [(rows[COL_LAT].iloc[0], rows[COL_LON].iloc[0])
+                            for rows in self._stations.values() if rows[COL_DWD_LOADED].any()]
+        self._tree_locations = np.array(loaded_locations, dtype=float).reshape(-1, 2)
+        self._tree = None
+        if loaded_locations:
+            self._tree = cKDTree(_to_unit_vectors(self._tree_locations[:, 0], self._tree_locations[:, 1]))
 
     def get_values(self, date_times: datetime | List[datetime],
                    lat: float,
@@ -126,59 +199,73 @@ class DWDStations:
          Note:
          This method first checks for the existence of the station at the given coordinates. It then prepares a
          DataFrame to collect results for the requested times and parameters. Data is loaded from corresponding
-         files and merged into the result DataFrame. The method handles missing data gracefully, filling missing
-         values where possible, and strips whitespace from parameter names to ensure accurate matching.
+         files, aligned to the requested times and joined with the result DataFrame in a single concatenation. The
+         method handles missing data gracefully, filling missing values where possible. The values are already
+         stripped of whitespace when the file is read.
          Removes entries containing NaN.
          """
 
-        def conv_to_list(data):
-            if not isinstance(data, list):
-                data = [data]
-            return data
-
         # perpare data
-        date_times = conv_to_list(date_times)
-        params = conv_to_list(params)
+        if not isinstance(params, list):
+            params = [params]
         lat: float = round(lat, 4)
         lon: float = round(lon, 4)
         # check if lat, lon exist and file is loaded
-        if self.df.loc[(self.df[COL_LAT] == lat)
-                       & (self.df[COL_LON] == lon)
-                       & (self.df[COL_DWD_LOADED] == True)].empty:
+        station: DataFrame = self._stations.get(_location_key(lat, lon))
+        if station is None or not station[COL_DWD_LOADED].any():
             return pd.DataFrame()
-        # write all used datetimes
-        date_times = pd.DataFrame(date_times, columns=["Datetime"])
-        # Init start structure
-        result_df: DataFrame = pd.DataFrame()
-        result_df[COL_DATE] = date_times["Datetime"].apply(gFunc.round_to_nearest_hour)
-        result_df[COL_DATE] = result_df[COL_DATE].apply(gFunc.datetime_to_strf)  # !!
-        result_df[COL_STATION_ID] = self.df.loc[(self.df[COL_LAT] == lat)
-                                                & (self.df[COL_LON] == lon), COL_STATION_ID].iloc[0]
-        result_df[COL_LAT] = lat
-        result_df[COL_LON] = lon
-        result_df[COL_STATION_HEIGHT] = np.nan
-        # check if all params used or not. Ignore empty param
+        # check if all params used or not
         if use_all_params or params is None:
-            params = [param for param in self.df[COL_PARAM].unique().tolist() if param.strip()]
-        # fill structure for each param
-        for param in params:
-            row: DataFrame = self.df.loc[(self.df[COL_LAT] == lat)
-                                         & (self.df[COL_LON] == lon)
-                                         & (self.df[COL_PARAM] == param)]
-            if row.empty:
-                continue
-            filename: str = row[COL_DWD_FILENAME].iloc[0]
-            height: float = float(row[COL_STATION_HEIGHT].iloc[0])
-            if os.path.exists(filename):
-                df_file = read_file_to_df(filename)
-                matching_rows = df_file[df_file[COL_DATE].isin(result_df[COL_DATE])].copy()
-                if not matching_rows.empty:
-                    matching_rows[param] = matching_rows[param].str.strip()
-                    result_df = result_df.merge(matching_rows[[COL_DATE, param]], on=COL_DATE, how='left')
-                    result_df[COL_STATION_HEIGHT].fillna(height, inplace=True)
-        result_df.dropna(inplace=True)
-        result_df[COL_DATE] = pd.to_datetime(result_df[COL_DATE], format="%Y%m%d%H")
-        return result_df
+            params = self._params
+        return self._get_station_values(station, lat, lon, _round_request_dates(date_times), params)
+
+    def get_values_many(self, date_times: datetime | List[datetime],
+                        coords: Tuple[float, float] | List[Tuple[float, float]] | NDArray,
+                        use_all_params: bool = True,
+                        params: str | List[str] = None) -> DataFrame:
+        """
+        Retrieves weather data for the same dates at several locations, with the same result for each location as
+        `get_values(...)`.
+
+        :param date_times: A single datetime or a list of datetimes for which data is requested.
+        :param coords: A single tuple of (latitude, longitude), a list of tuples or a numpy array with the shape (n, 2).
+        :param use_all_params: Boolean flag to indicate whether data should be retrieved for all available parameters.
+                               Defaults to True. If False, only specified 'params' are used.
+        :param params: Optional single parameter or list of parameters to filter the data. If None and
+                       'use_all_params' is False, no data is returned.
+
+        :return: A pandas DataFrame with the rows of all locations, in the order of the coordinates, or an empty
+                 DataFrame if no data is available for any location.
+
+        Note:
+        The requested dates are rounded only once for all locations. Before the first location is processed, the files
+        of all requested stations that were not read yet are read in parallel threads, each file only once. Locations
+        without a loaded station are skipped. Parameters missing at a station are NaN in the rows of this station.
+        """
+        if not isinstance(params, list):
+            params = [params]
+        if use_all_params or params is None:
+            params = self._params
+        np_coords = np.array(coords, dtype=float).reshape(-1, 2)
+        stations: List[Tuple[float, float, DataFrame]] = []
+        for lat, lon in np_coords:
+            lat, lon = round(float(lat), 4), round(float(lon), 4)
+            station = self._stations.get(_location_key(lat, lon))
+            if station is not None and station[COL_DWD_LOADED].any():
+                stations.append((lat, lon, station))
+        if not stations:
+            return pd.DataFrame()
+        # read the requested files of all stations at once
+        filenames = pd.concat([station.loc[station[COL_DWD_LOADED] & station[COL_PARAM].isin(params),
+                                           COL_DWD_FILENAME] for _, _, station in stations])
+        self._read_files(filenames.unique().tolist())
+        dates = _round_request_dates(date_times)
+        result_dfs = [self._get_station_values(station, lat, lon, dates, params)
+                      for lat, lon, station in tqdm(stations, total=len(stations), desc="Processing DWD-Values")]
+        result_dfs = [result_df for result_df in result_dfs if not result_df.empty]
+        if not result_dfs:
+            return pd.DataFrame()
+        return pd.concat(result_dfs, ignore_index=True)
 
     def get_station_locations(self) -> DataFrame:
         """
@@ -195,61 +282,220 @@ class DWDStations:
         """
         return self.df[[COL_LAT, COL_LON]].drop_duplicates()
 
-    def _add_entry(self, datastr: str) -> bool:
+    def get_station_coords(self) -> NDArray:
+        """
+        Retrieves the unique latitude and longitude coordinates of the DWD stations as a numpy array.
+
+        :return: A numpy array (float64) with the shape (n, 2) containing latitude and longitude of each station, in
+        the same order as `get_station_locations()`.
+
+        Note:
+        The array can be passed directly to vectorized calculations (e.g. distances) or to `Grib2Datas.get_values(...)`
+        without converting each coordinate into a Python tuple.
+        """
+        return self.get_station_locations().to_numpy(dtype=np.float64)
+
+    def get_nearest_stations(self, coords: Tuple[float, float] | List[Tuple[float, float]]) -> DataFrame:
         """
-        Parses a data string to extract station information and either updates existing records or adds a new entry
-        to the DataFrame. The data string is expected to contain station ID, start date, end date, station height,
-        latitude, longitude, and additional information in a specified format.
+        Finds the location of the nearest loaded DWD station for each given coordinate.
 
-        :param datastr: A string containing delimited data about a weather station.
+        :param coords: A single tuple of (latitude, longitude) or a list of tuples for multiple coordinates.
 
-        :return: A boolean indicating whether a new entry was added to the DataFrame. Returns True if a new entry
-        is added, and False if an existing entry is updated.
+        :return: A pandas DataFrame with the columns latitude (COL_LAT) and longitude (COL_LON) of the nearest
+        station, one row for each coordinate in the same order. The DataFrame is empty if no station is loaded.
+
+        Note:
+        The stations are stored in a KD-tree (scipy.spatial.cKDTree) when a folder is loaded, so all coordinates are
+        searched with one query in O(log n) each. The coordinates are converted into points on the unit sphere, the
+        nearest point is therefore also the nearest station on the earth's surface. The returned location can be
+        used directly with `get_values(...)`.
+        """
+        if not isinstance(coords, list):
+            coords = [coords]
+        if self._tree is None or len(coords) == 0:
+            return DataFrame(columns=[COL_LAT, COL_LON])
+        np_coords = np.array(coords, dtype=float).reshape(-1, 2)
+        _, indexes = self._tree.query(_to_unit_vectors(np_coords[:, 0], np_coords[:, 1]))
+        return DataFrame(self._tree_locations[indexes], columns=[COL_LAT, COL_LON])
+
+    def load_values(self, use_cache_files: bool = False):
+        """
+        Reads the values of all loaded DWD station files into memory. Every following call of `get_values(...)` uses
+        these values and does not read any file.
 
-        :raises ValueError: If the data string does not match the expected format, which could indicate a problem
-                            with input data.
+        :param use_cache_files: Boolean flag to indicate whether the parsed content of each file is stored in a cache
+                                file next to it (file name + `DWD_CACHE_EXTENSION`). Defaults to False. If True, a cache
+                                file that is newer than its DWD file is loaded instead of parsing the DWD file again.
 
         Note:
-        The function uses regular expressions to parse the data string. It checks for the station's presence in the
-        DataFrame using the station ID. If the station exists, it updates the start and end dates if the new dates
-        extend the current recording period. If the station does not exist, it adds a new row with the station's data.
-        The method assumes the date format is 'YYYYMMDD' for both start and end dates.
+        Without this method the files are read on the first request of the respective station. For requests over
+        all stations (e.g. the combination with the model data) it is faster to read all files at once: the files
+        are parsed in parallel threads, because pandas releases the GIL while parsing the csv content. Files that
+        were already read are not read again. The cache files are npz files with the parsed columns next to the DWD
+        files, loading them skips the csv parsing on repeated runs. A cache file is created again as soon as the DWD
+        file has been changed. The cache files are not removed by this class, delete them together with the DWD files.
+        """
+        self._read_files(self.df.loc[self.df[COL_DWD_LOADED], COL_DWD_FILENAME].unique().tolist(), use_cache_files)
+
+    def _read_files(self, filenames: List[str], use_cache_files: bool = False):
+        """
+        Reads the DWD station files that were not read yet in parallel threads and stores their content, see
+        `load_values(...)`.
+
+        :param filenames: The paths to the DWD station text files. Files that do not exist are skipped.
+        :param use_cache_files: Boolean flag to indicate whether the cache files are used. Defaults to False.
+        """
+        stamps = {filename: gFunc.get_file_stamp(filename) for filename in filenames if filename not in self._file_dfs}
+        filenames = [filename for filename, stamp in stamps.items() if stamp is not None]
+        if not filenames:
+            return
+        with ThreadPoolExecutor(max_workers=min(32, len(filenames))) as executor:
+            file_dfs = list(tqdm(executor.map(_read_sorted_file_df, filenames, repeat(use_cache_files)),
+                                 total=len(filenames), desc="Reading DWD-Values"))
+        self._file_dfs.update(zip(filenames, file_dfs))
+        self._file_stamps.update((filename, stamps[filename]) for filename in filenames)
+
+    def _get_station_values(self, station: DataFrame, lat: float, lon: float, dates: pd.DatetimeIndex,
+                            params: List[str]) -> DataFrame:
+        """
+        Collects the values of the parameters of a station for the requested dates, see `get_values(...)`.
+
+        :param station: The rows of the station in `df`.
+        :param lat: The (rounded) latitude of the station.
+        :param lon: The (rounded) longitude of the station.
+        :param dates: The requested dates, rounded to the nearest hour (see `_round_request_dates(...)`).
+        :param params: The requested parameters.
+
+        :return: A pandas DataFrame with the requested dates and each parameter of the station as a column. Rows with
+                 missing values are removed.
         """
-        match = re.search(r"(\d+) (\d+) (\d+)\s+(-?\d+)\s+([\d.]+)\s+([\d.]+)\s+(.*)", datastr)
-        if match:
-            station_id: int = int(match.group(1))
-            start_date = datetime.strptime(match.group(2), "%Y%m%d")
-            end_date = datetime.strptime(match.group(3), "%Y%m%d")
-            if self.df[COL_STATION_ID].isin([station_id]).any():
-                # compare start_date and end_date and apply it
-                if start_date < self.df.loc[self.df[COL_STATION_ID] == station_id, COL_DATE_START].iloc[0]:
-                    self.df.loc[self.df[COL_STATION_ID] == station_id, COL_DATE_START] = start_date
-                if end_date > self.df.loc[self.df[COL_STATION_ID] == station_id, COL_DATE_END].iloc[0]:
-                    self.df.loc[self.df[COL_STATION_ID] == station_id, COL_DATE_END] = end_date
-                return False
-            new_row = {
-                COL_STATION_ID: station_id,
-                COL_DATE_START: start_date,
-                COL_DATE_END: end_date,
-                COL_STATION_HEIGHT: int(match.group(4)),
-                COL_LAT: float(match.group(5)),
-                COL_LON: float(match.group(6)),
-                COL_DWD_FILENAME: "",
-                COL_PARAM: "",
-                COL_DWD_LOADED: False,
-            }
-            self.df.loc[len(self.df)] = new_row
-            return True
+        # Init start structure
+        result_df: DataFrame = pd.DataFrame()
+        result_df[COL_DATE] = dates
+        result_df[COL_STATION_ID] = station[COL_STATION_ID].iloc[0]
+        result_df[COL_LAT] = lat
+        result_df[COL_LON] = lon
+        result_df[COL_STATION_HEIGHT] = np.nan
+        date_keys = result_df[COL_DATE].unique()
+        # group the params by their file, each file is searched and merged only once
+        station_files = dict(zip(station[COL_PARAM], station[COL_DWD_FILENAME]))
+        file_params: dict[str, List[str]] = {}
+        for param in params:
+            filename = station_files.get(param)
+            if filename is not None and param not in file_params.get(filename, []):
+                file_params.setdefault(filename, []).append(param)
+        height: float = float(station[COL_STATION_HEIGHT].iloc[0])
+        # columns of each file aligned to the requested dates, joined with the result at once
+        param_columns: List[DataFrame] = []
+        for filename, param_list in file_params.items():
+            # the existence of the file is only checked on the first request
+            df_file = self._get_file_df(filename)
+            if df_file is None:
+                continue
+            matching_rows = df_file.iloc[_find_date_rows(df_file[COL_DATE].to_numpy(), date_keys)]
+            if not matching_rows.empty:
+                param_columns.append(matching_rows.set_index(COL_DATE)[param_list].reindex(result_df[COL_DATE]))
+                result_df[COL_STATION_HEIGHT] = height
+        if param_columns:
+            wide_df = pd.concat(param_columns, axis=1)
+            wide_df.index = result_df.index
+            result_df = pd.concat([result_df, wide_df], axis=1)
+        # same order of the params as requested
+        result_df = result_df[[column for column in result_df.columns if column not in station_files]
+                              + [param for param in dict.fromkeys(params) if param in station_files
+                                 and param in result_df.columns]]
+        result_df.dropna(inplace=True)
+        return result_df
+
+    def _get_file_df(self, filename: str) -> DataFrame | None:
+        """
+        Returns the content of a DWD station file as a DataFrame. The file is only parsed on the first request,
+        every further request uses the stored DataFrame.
+
+        :param filename: The path to the DWD station text file.
+
+        :return: A pandas DataFrame with the content of the file, see `read_file_to_df(...)`, or None if the file does
+                 not exist.
+
+        Note:
+        The returned DataFrame is shared between the requests and must not be changed by the caller. The file system
+        is only accessed if the file is not stored yet. The stored content is kept by `load_folder(...)` as long as
+        the modification time and size of the file are unchanged.
+        """
+        df_file = self._file_dfs.get(filename)
+        if df_file is None:
+            stamp = gFunc.get_file_stamp(filename)
+            if stamp is None:
+                return None
+            df_file = _read_sorted_file_df(filename)
+            self._file_dfs[filename] = df_file
+            self._file_stamps[filename] = stamp
+        return df_file
+
+    def _add_entries(self, contents: List[str]) -> int:
+        """
+        Parses the lines of the initialization files to extract the station information and either updates existing
+        records or adds new entries to the DataFrame. Each line is expected to contain station ID, start date, end
+        date, station height, latitude, longitude, and additional information in a specified format.
+
+        :param contents: A list of strings, each containing the lines with delimited data about weather stations.
+
+        :return: The number of new stations added to the DataFrame.
+
+        Note:
+        All lines of a content are parsed with one call of a multiline regular expression, the dates and numbers are
+        converted column by column. Lines that do not match the format are ignored. A station listed in several
+        initialization files gets the earliest start date and the latest end date. If the station already exists in
+        the DataFrame, its start and end dates are only extended. The method assumes the date format is 'YYYYMMDD'
+        for both start and end dates.
+        """
+        matches = DataFrame([match for content in contents for match in _INIT_LINE_PATTERN.findall(content)])
+        if matches.empty:
+            return 0
+        stations = DataFrame({
+            COL_STATION_ID: matches[0].astype(int),
+            COL_DATE_START: pd.to_datetime(matches[1], format="%Y%m%d"),
+            COL_DATE_END: pd.to_datetime(matches[2], format="%Y%m%d"),
+            COL_STATION_HEIGHT: matches[3].astype(int),
+            COL_LAT: matches[4].astype(float),
+            COL_LON: matches[5].astype(float),
+        })
+        # combine the recording periods of stations listed in several init files
+        stations = stations.groupby(COL_STATION_ID, sort=False).agg({COL_DATE_START: "min",
+                                                                     COL_DATE_END: "max",
+                                                                     COL_STATION_HEIGHT: "first",
+                                                                     COL_LAT: "first",
+                                                                     COL_LON: "first"})
+        # compare start_date and end_date of existing stations and apply it
+        existing = self.df[COL_STATION_ID].isin(stations.index)
+        existing_ids = self.df.loc[existing, COL_STATION_ID]
+        if existing.any():
+            self.df.loc[existing, COL_DATE_START] = np.minimum(self.df.loc[existing, COL_DATE_START],
+                                                               existing_ids.map(stations[COL_DATE_START]))
+            self.df.loc[existing, COL_DATE_END] = np.maximum(self.df.loc[existing, COL_DATE_END],
+                                                             existing_ids.map(stations[COL_DATE_END]))
+        # add all new stations at once - only the already found IDs are compared, not the whole column again
+        new_stations = stations[~stations.index.isin(existing_ids)].reset_index()
+        new_stations[COL_DWD_FILENAME] = ""
+        new_stations[COL_PARAM] = ""
+        new_stations[COL_DWD_LOADED] = False
+        new_stations = new_stations[self.df.columns]
+        if self.df.empty:
+            self.df = new_stations
         else:
-            return False
+            self.df = pd.concat([self.df, new_stations], ignore_index=True)
+        return len(new_stations)
 
-    def _load_file(self, filename: str) -> bool:
+    def _load_file(self, filename: str, warnings: List[str] = None, file_info: _FileInfo = None) -> bool:
         """
          Loads data from a DWD station text file specified by the filename into the DataFrame. This method reads
          station IDs and parameters from the file, checks if these exist in the DataFrame, and then updates or
          appends the data accordingly.
 
          :param filename: The path to the DWD station text file to be loaded.
+         :param warnings: Optional list that collects the warning messages. If None, a warning is printed directly.
+         :param file_info: Optional information already read from the file with `_read_file_info(...)`. If None, the
+                           file is read by this method.
 
          :return: A boolean indicating whether the file was successfully processed. Returns True if data from the file
                   was successfully added or updated in the DataFrame, and False if the station ID does not exist or no
@@ -262,61 +508,93 @@ class DWDStations:
          This method first reads the station ID and parameters from the file. It then checks if the station ID exists
          in the DataFrame. If it does, the method either updates the existing entry with new parameters and dates or
          adds new rows for additional parameters not previously recorded. If the station ID does not exist, it outputs
-         a warning and returns False. This method ensures that all parameters and date ranges for each station are
-         up-to-date according to the latest files processed.
+         or collects a warning and returns False. This method ensures that all parameters and date ranges for each
+         station are up-to-date according to the latest files processed.
+         The new rows are collected and only appended to the DataFrame by `_append_new_rows()`, which must be called
+         after the last file.
          """
-        a_id: int = _read_id(filename)
-        params = _read_params(filename)
+        if file_info is None:
+            file_info = _read_file_info(filename, self._station_rows.keys())
+        a_id, params, start_date, end_date = file_info
         if not params:
             return False
 
-        row_index = self.df.index[self.df[COL_STATION_ID] == a_id].tolist()
+        row_index = self._station_rows.get(a_id)
         if not row_index:
-            print(Fore.YELLOW +
-                  f"\nStation ID '{a_id}' does not exist. Maybe the initialization file for the file "
-                  f"'{filename}' was not loaded or the station ID does not exist in the initialization file."
-                  + Style.RESET_ALL)
+            warning = (f"Station ID '{a_id}' does not exist. Maybe the initialization file for the file "
+                       f"'{filename}' was not loaded or the station ID does not exist in the initialization file.")
+            if warnings is None:
+                print(Fore.YELLOW + "\n" + warning + Style.RESET_ALL)
+            else:
+                warnings.append(warning)
             return False
 
-        # read file as text - from beginning
-        start_date = _read_min_date(filename)
-        # read file as byte - from the end
-        end_date = _read_max_date(filename)
-
         # Check if a parameter is already set for this StationId - used to load mutliple datasets
         # for example: load station for temperatur and cloud coverage
         # dataset cloud coverage extended the dataset for temperatur
         if self.df.at[row_index[0], COL_PARAM]:
             # If yes, copy the line for each additional parameter
+            station_params = {self._new_rows[row][COL_PARAM] if row in self._new_rows else self.df.at[row, COL_PARAM]
+                              for row in row_index}
             for param in params:
-                if self.df.loc[self.df[COL_STATION_ID] == a_id, COL_PARAM].isin([param]).any():
+                if param in station_params:
                     continue
-                new_row = self.df.loc[row_index[0]].copy()
+                station_params.add(param)
+                new_row = self.df.loc[row_index[0]].to_dict()
                 new_row[COL_PARAM] = param
                 new_row[COL_DWD_FILENAME] = filename
-                self.df.loc[len(self.df)] = new_row
+                self._add_new_row(row_index, new_row)
         else:
             # If no, insert the first parameter in the existing line
             self.df.at[row_index[0], COL_PARAM] = params[0]
-            # Set general information for the existing line
-            self.df.loc[self.df[COL_STATION_ID] == a_id, [COL_DWD_LOADED, COL_DWD_FILENAME,
-                                                          COL_DATE_START, COL_DATE_END]] = [True, filename,
-                                                                                            start_date,
-                                                                                            end_date]
+            # Set general information for the existing line with a single assignment
+            columns: List[str] = [COL_DWD_LOADED, COL_DWD_FILENAME]
+            values: list = [True, filename]
+            # without dates the recording period of the init file is kept
+            if start_date is not None and end_date is not None:
+                columns += [COL_DATE_START, COL_DATE_END]
+                values += [start_date, end_date]
+            self.df.loc[row_index, columns] = values
             # For each additional parameter, add a new line
             for param in params[1:]:
-                new_row = self.df.loc[row_index[0]].copy()
+                new_row = self.df.loc[row_index[0]].to_dict()
                 new_row[COL_PARAM] = param
-                self.df.loc[len(self.df)] = new_row
+                self._add_new_row(row_index, new_row)
         return True
 
-    def _read_init_files(self, path: str):
+    def _add_new_row(self, row_index: List[int], new_row: dict):
+        """
+        Collects a new row of a station, the row is appended to the DataFrame by `_append_new_rows()`.
+
+        :param row_index: The list with the row labels of the station, the label of the new row is added to it.
+        :param new_row: A dict with the values of the new row for each column of the DataFrame.
+        """
+        label = len(self.df) + len(self._new_rows)
+        row_index.append(label)
+        self._new_rows[label] = new_row
+
+    def _append_new_rows(self):
+        """
+        Appends all rows collected by `_add_new_row(...)` to the DataFrame with a single concatenation.
+
+        Note:
+        Appending each row on its own would copy every column of the DataFrame for each new row.
+        """
+        if not self._new_rows:
+            return
+        new_rows = DataFrame.from_dict(self._new_rows, orient="index").astype(self.df.dtypes.to_dict())
+        self.df = pd.concat([self.df, new_rows[self.df.columns]])
+        self._new_rows.clear()
+
+    def _read_init_files(self, path: str, init_files: List[str] = None):
         """
         Reads initialization files containing station data from a specified directory. This method filters files that
         match defined markers indicating they are initialization files and then reads these files to populate the
         DataFrame with station data.
 
         :param path: The directory path that contains the initialization files.
+        :param init_files: Optional list of the initialization files in the directory. If None, the directory is
+                           searched.
 
         :raises FileNotFoundError: If no initialization files are found in the specified directory, or if the files do
                                   not contain the expected markers in their filenames.
@@ -325,62 +603,261 @@ class DWDStations:
         Note:
         The function looks for files containing specific markers, 'INIT_FILE_HOURLY_MARKER' or 'INIT_FILE_10_MIN_MARKER'
         ,in their names to identify relevant initialization files. It reads through these files, ignoring headers, and
-        processes each line to extract and add station data to the DataFrame using the `_add_entry` method. If after
+        processes all lines to extract and add station data to the DataFrame using the `_add_entries` method. If after
         processing all files, the DataFrame remains empty, it indicates that the files were corrupted or improperly
         formatted.
         """
-        files: list[str] = gFunc.get_files(path, ".txt")
-        init_files: list[str] = []
-        for a_file in files:
-            if INIT_FILE_HOURLY_MARKER.lower() in str(a_file).lower():
-                init_files.append(str(os.path.abspath(a_file)))
-            elif INIT_FILE_10_MIN_MARKER.lower() in str(a_file).lower():
-                init_files.append(str(os.path.abspath(a_file)))
+        if init_files is None:
+            init_files = [a_file for a_file in gFunc.get_files(path, ".txt") if _is_init_file(a_file)]
         if not init_files:
             raise FileNotFoundError(f"DWD-Stations init file not exist in '{path}'. The file name must contain the "
                                     f"following: '[{INIT_FILE_HOURLY_MARKER}, {INIT_FILE_10_MIN_MARKER}]'")
         # Read the init File -> Content: all Ids of DWD Stations
+        contents: list[str] = []
         for init_file in init_files:
             with open(init_file, "r") as content:
                 # Skip Header line
-                content.readline()
+                next(content, None)
                 # Skip Splitter line
-                content.readline()
-                for line in content:
-                    line = line.strip()
-                    if line:
-                        self._add_entry(line)
+                next(content, None)
+                contents.append(content.read())
+        self._add_entries(contents)
         if len(self.df) == 0:
             raise CorruptedInitFileError("Init file contains no information on DWD stations.")
         self.df.sort_values(by=COL_STATION_ID, inplace=True)
+        self._station_rows = {station_id: rows.tolist()
+                              for station_id, rows in self.df.groupby(COL_STATION_ID).groups.items()}
 
 
-def _read_min_date(filename: str) -> datetime:
+def _read_sorted_file_df(filename: str, use_cache_file: bool = False) -> DataFrame:
     """
-    Reads the earliest date from a specified file. The function assumes the date is located on the second line
-    of the file and is formatted in a specific way within that line.
+    Reads a DWD station file with `read_file_to_df(...)` and sorts it by date, if it is not already sorted.
 
-    :param filename: The path to the file from which to read the date.
+    :param filename: The path to the DWD station text file.
+    :param use_cache_file: Boolean flag to indicate whether the result is loaded from or stored in the cache file
+                           (file name + `DWD_CACHE_EXTENSION`). Defaults to False.
 
-    :return: A datetime object representing the earliest date found in the file.
+    :return: A pandas DataFrame with the content of the file, sorted by date.
 
-    :raises ValueError: If the date in the file does not conform to the expected format.
-    :raises FileNotFoundError: If the file cannot be found or read.
+    Note:
+    The cache file is only used if it is newer than the DWD file. If the cache file cannot be read (e.g. it is
+    incomplete or from another version), the DWD file is parsed again and the cache file is replaced. If the cache
+    file cannot be written, the DataFrame is returned anyway.
+    """
+    cache_filename = filename + DWD_CACHE_EXTENSION
+    if (use_cache_file and os.path.exists(cache_filename)
+            and os.path.getmtime(cache_filename) >= os.path.getmtime(filename)):
+        try:
+            return _read_cache_file(cache_filename)
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            pass
+    df_file = read_file_to_df(filename)
+    # the dates are searched binary, see `_find_date_rows(...)`
+    if not df_file[COL_DATE].is_monotonic_increasing:
+        df_file = df_file.sort_values(by=COL_DATE, kind="stable")
+    if use_cache_file:
+        try:
+            _write_cache_file(df_file, cache_filename)
+        except OSError:
+            pass
+    return df_file
+
+
+def _write_cache_file(df_file: DataFrame, cache_filename: str):
+    """
+    Stores the content of a DWD station file as numpy arrays in an uncompressed npz file.
+
+    :param df_file: The DataFrame of `read_file_to_df(...)`.
+    :param cache_filename: The path of the cache file.
+
+    :raises OSError: If the cache file cannot be written.
+
+    Note:
+    The arrays are first written to a temporary file in the same directory, which replaces the cache file after it
+    was written completely, so an interrupted run never leaves a partial cache file. The text columns are stored as
+    fixed-width unicode arrays together with the mask of their missing values, so no object is pickled.
+    """
+    arrays = {"columns": np.array(df_file.columns, dtype=str), "index": df_file.index.to_numpy()}
+    for i, column in enumerate(df_file.columns):
+        if df_file[column].dtype == object:
+            arrays[f"null_{i}"] = df_file[column].isna().to_numpy()
+            arrays[f"values_{i}"] = df_file[column].fillna("").to_numpy(dtype=str)
+        else:
+            arrays[f"values_{i}"] = df_file[column].to_numpy()
+    handle, tmp_filename = tempfile.mkstemp(suffix=DWD_CACHE_EXTENSION, dir=os.path.dirname(cache_filename))
+    try:
+        with os.fdopen(handle, "wb") as content:
+            np.savez(content, **arrays)
+        os.replace(tmp_filename, cache_filename)
+    except BaseException:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        raise
+
+
+def _read_cache_file(cache_filename: str) -> DataFrame:
+    """
+    Loads the content of a DWD station file from a cache file of `_write_cache_file(...)`.
+
+    :param cache_filename: The path of the cache file.
+
+    :return: A pandas DataFrame with the same columns and types as the result of `read_file_to_df(...)`.
+
+    :raises OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile: If the cache file is incomplete or invalid.
+
+    Note:
+    The file is loaded with `allow_pickle=False`, so loading a cache file never executes code.
+    """
+    with np.load(cache_filename, allow_pickle=False) as arrays:
+        data = {}
+        for i, column in enumerate(arrays["columns"].tolist()):
+            values = arrays[f"values_{i}"]
+            if f"null_{i}" in arrays.files:
+                text = values.astype(object)
+                text[arrays[f"null_{i}"]] = np.nan
+                values = text
+            data[column] = values
+        return DataFrame(data, index=arrays["index"])
+
+
+def _is_init_file(filename: str) -> bool:
+    """
+    Checks by its name if a file is a DWD station initialization file.
+
+    :param filename: The path to the file.
+
+    :return: True if the file name (without the directory) contains 'INIT_FILE_HOURLY_MARKER' or
+             'INIT_FILE_10_MIN_MARKER' (case-insensitive), otherwise False.
+    """
+    lower_filename = os.path.basename(filename).lower()
+    return INIT_FILE_HOURLY_MARKER.lower() in lower_filename or INIT_FILE_10_MIN_MARKER.lower() in lower_filename
+
+
+def _round_request_dates(date_times: datetime | List[datetime]) -> pd.DatetimeIndex:
+    """
+    Rounds the requested dates of `DWDStations.get_values(...)` to the nearest hour.
+
+    :param date_times: A single datetime or a list of datetimes.
+
+    :return: A DatetimeIndex with the rounded dates, with the same dtype as the parsed date column of the DWD files.
+    """
+    if not isinstance(date_times, list):
+        date_times = [date_times]
+    date_times = pd.DataFrame(date_times, columns=["Datetime"])
+    return pd.to_datetime(gFunc.round_to_nearest_hours(date_times["Datetime"])).astype("datetime64[ns]")
+
+
+def _find_date_rows(file_dates: NDArray, date_keys: NDArray) -> NDArray:
+    """
+    Finds the rows of a DWD file that contain the given dates.
+
+    :param file_dates: A numpy array (datetime64) with the dates of the file, sorted in ascending order.
+    :param date_keys: A numpy array (datetime64) with the searched dates.
+
+    :return: A numpy array with the positions of the rows in `file_dates` that contain one of the searched dates.
+
+    Note:
+    The DWD files are sorted by time, so each date is found by binary search in O(log n) instead of comparing the
+    whole column. The dates are compared as 64-bit integers.
+    """
+    if len(file_dates) == 0 or len(date_keys) == 0:
+        return np.empty(0, dtype=int)
+    positions = np.searchsorted(file_dates, date_keys)
+    found = positions < len(file_dates)
+    found[found] = file_dates[positions[found]] == date_keys[found]
+    return positions[found]
+
+
+def _location_key(lat: float, lon: float) -> Tuple[int, int]:
+    """
+    Converts a latitude and longitude into the key of a station location.
+
+    :param lat: The latitude in degree.
+    :param lon: The longitude in degree.
+
+    :return: A tuple with latitude and longitude as integers in units of 1e-4 degree (the precision of the DWD
+             station coordinates).
 
     Note:
-    This function is designed to read standard formatted DWD data files where the first line after the header
-    contains date information. The date is expected to be in the format 'YYYYMMDDHH', and this function will
-    handle date strings that may contain additional characters by truncating to the first 10 characters.
+    Integer keys are compared exactly, coordinates that differ only by floating point errors get the same key.
+    """
+    return round(lat * _LOCATION_SCALE), round(lon * _LOCATION_SCALE)
+
+
+def _to_unit_vectors(lats: NDArray, lons: NDArray) -> NDArray:
+    """
+    Converts latitudes and longitudes into cartesian coordinates on the unit sphere.
+
+    :param lats: A numpy array with latitudes in degree.
+    :param lons: A numpy array with longitudes in degree.
+
+    :return: A numpy array with the shape (n, 3) containing the x, y and z coordinates.
+    """
+    lats = np.radians(lats)
+    lons = np.radians(lons)
+    return np.column_stack((np.cos(lats) * np.cos(lons), np.cos(lats) * np.sin(lons), np.sin(lats)))
+
+
+def _read_file_info(filename: str, station_ids: Container[int], read_dates: bool = True) -> _FileInfo:
+    """
+    Reads the station ID, the parameters and the recording period of a DWD station file. This function only reads
+    the file and does not change any data, so it can be used in parallel threads.
+
+    :param filename: The path to the DWD station text file.
+    :param station_ids: The IDs of all known stations (e.g. the keys of a dict). The dates are only read for known
+    stations.
+    :param read_dates: Boolean flag to indicate whether the first and last date are read. Defaults to True.
+
+    :return: A tuple with the station ID, the list of parameters, the first date and the last date of the file. The
+             dates are None if the file contains no parameters, the station ID is unknown or `read_dates` is False.
+    """
+    # read file as text - header and first line with one call
+    header_line, first_line = _read_head(filename)
+    a_id: int = _parse_id(first_line)
+    params = _parse_params(header_line)
+    if not params or a_id not in station_ids or not read_dates:
+        return a_id, params, None, None
+    start_date = _parse_min_date(first_line)
+    # read file as byte - from the end
+    end_date = _read_max_date(filename)
+    return a_id, params, start_date, end_date
+
+
+def _read_head(filename: str) -> Tuple[str, str]:
+    """
+    Reads the header line and the first data line of a DWD station file with a single opening of the file.
+
+    :param filename: The path to the DWD station text file.
+
+    :return: A tuple with the header line and the first data line (stripped). Both are empty strings if the file does
+             not exist, the first data line is empty if the file contains no data.
     """
+    if not os.path.exists(filename):
+        return "", ""
     with open(filename, 'r') as content:
-        # Skip Header line
-        content.readline()
+        header_line: str = content.readline()
         first_line: str = content.readline().strip()
-        date_str = first_line.split(";")[1]
-        if len(date_str) > 10:
-            date_str = date_str[:10]
-        date: datetime = datetime.strptime(date_str, "%Y%m%d%H")
-        return date
+        return header_line, first_line
+
+
+def _parse_min_date(first_line: str) -> datetime:
+    """
+    Parses the earliest date from the first data line of a DWD station file (see `_read_head(...)`).
+
+    :param first_line: The first line after the header of the file.
+
+    :return: A datetime object representing the earliest date found in the file.
+
+    :raises ValueError: If the date in the line does not conform to the expected format.
+    :raises IndexError: If the line contains no date column.
+
+    Note:
+    The date is expected in the second column in the format 'YYYYMMDDHH', date strings that contain additional
+    characters are truncated to the first 10 characters.
+    """
+    date_str = first_line.split(";")[1]
+    date: datetime = gFunc.strf_to_datetime(date_str)
+    return date
 
 
 def _read_max_date(filename: str) -> datetime:
@@ -398,35 +875,29 @@ def _read_max_date(filename: str) -> datetime:
     :raises FileNotFoundError: If the file cannot be found or read.
 
     Note:
-    This function operates by reading the file from the end to the beginning, looking for the first occurrence
-    of a newline character followed by a semicolon, indicating the presence of a date in 'YYYYMMDDHH' format.
+    This function maps the file into memory (mmap) and searches its lines backwards with `rfind` for the last line
+    containing a semicolon, indicating the presence of a date in 'YYYYMMDDHH' format. Only the pages at the end of
+    the file are read and nothing is copied except the found line. The header line of the file is not searched.
     This method ensures efficient processing, particularly useful for large files. If no date is found, or if
     the date is improperly formatted, a default date is returned to avoid errors in the calling function.
     """
     with open(filename, 'rb') as content:
-        # Go to the last byte of the file
-        content.seek(0, os.SEEK_END)
-        position: int = content.tell()
-        line: str = ''
-        while position >= 0:
-            content.seek(position)
-            next_char = content.read(1)
-            # Search backwards until you find a line break
-            if next_char == b"\n":
-                # Check if line contains ";"
-                if ';' in line:
-                    # reverse the reversed string
-                    date_str = line[::-1].split(";")[1]
-                    if len(date_str) > 10:
-                        date_str = date_str[:10]
-                    date: datetime = datetime.strptime(date_str, "%Y%m%d%H")
+        # an empty file can not be mapped
+        if os.fstat(content.fileno()).st_size == 0:
+            return datetime(1970, 1, 1)
+        with mmap.mmap(content.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            end: int = len(data)
+            # Search backwards for the last line that contains ";", the first line is the header of the file
+            while end > 0:
+                start: int = data.rfind(b"\n", 0, end) + 1
+                if start == 0:
+                    break
+                line = data[start:end]
+                if b";" in line:
+                    date_str = line.split(b";")[1].decode()
+                    date: datetime = gFunc.strf_to_datetime(date_str)
                     return date
-                # reset temp var
-                line = ''
-            else:
-                # convert byte to char
-                line += next_char.decode()
-            position -= 1
+                end = start - 1
     return datetime(1970, 1, 1)
 
 
@@ -437,40 +908,47 @@ def read_file_to_df(filename: str) -> DataFrame:
 
     :param filename: The path to the CSV file to be read. The file is expected to be delimited by semicolons (';').
 
-    :return: A pandas DataFrame containing the data from the CSV file with formatted column headers and initial
-             data processing done for dates and station IDs.
+    :return: A pandas DataFrame containing the data from the CSV file with formatted column headers. The column
+             `COL_DATE` is returned as datetime64[ns], all other columns (including `COL_STATION_ID`) as text (object)
+             without leading and trailing spaces. The end of row column 'eor' is not part of the DataFrame.
 
     :raises FileNotFoundError: If the file specified does not exist.
     :raises pd.errors.ParserError: If there is an issue with CSV syntax during parsing.
 
     Note:
     The first row of the CSV file is expected to contain the headers, which are cleaned and used as DataFrame column
-    names. Specific columns like 'MESS_DATUM' for date and 'STATIONS_ID' for station identifiers are renamed for
-    consistency with further data handling conventions. Additionally, this function initially prepares to parse date
-    columns, though the actual parsing may be commented out or handled later depending on data structure or needs.
+    names. All values are read as strings with the C parser in one pass, without leading spaces, and remaining
+    trailing spaces are removed once per file, so the requests read clean values. Specific columns like 'MESS_DATUM'
+    for date and 'STATIONS_ID' for station identifiers are renamed for consistency with further data handling
+    conventions. Additionally, the date column is parsed once from the format
+    'YYYYMMDDHH' into datetime64, so the dates can be compared as integers without formatting each request.
     """
-    df = pd.read_csv(filename, sep=';', header=None, low_memory=False)
+    # read all values as text with the C parser, the type of each column is not guessed
+    # the leading spaces of the fixed-width values are removed while parsing
+    # the last column - end of row sign - is skipped by the parser and not removed afterwards
+    df = pd.read_csv(filename, sep=';', header=0, dtype=str, engine="c", skipinitialspace=True,
+                     usecols=lambda column: column.strip() != "eor")
     # remove empty spaces in headers
-    header = df.iloc[0].apply(lambda x: x.strip())
-    df.columns = header
-    # remove first line - contains headers
-    df = df.drop(0)
-    # remove last column - end of row sign
-    if "eor" in df.columns:
-        df.drop(columns=["eor"], inplace=True)
+    df.columns = df.columns.str.strip()
     # parse datetime column
     df.rename(columns={"MESS_DATUM": COL_DATE, "STATIONS_ID": COL_STATION_ID}, inplace=True)
-    # df[COL_DATE] = pd.to_datetime(df[COL_DATE], format="%Y%m%d%H")
+    df[COL_DATE] = pd.to_datetime(df[COL_DATE], format="%Y%m%d%H")
+    # strip all text columns once per file instead of each parameter on each request
+    text_columns = df.select_dtypes(include="object").columns
+    df[text_columns] = df[text_columns].apply(lambda column: column.str.strip())
     return df
 
 
-def extract_dwd_archives(path: str):
+def extract_dwd_archives(path: str, zip_files: List[str] = None) -> List[str]:
     """
     Extracts specific data files from all ZIP archives found in a given directory. This function targets files that
     contain a designated marker in their names, indicating they are relevant DWD data files.
 
     :param path: The directory path where the ZIP files are located. The function searches for all ZIP files in this
                  directory and processes each one found.
+    :param zip_files: Optional list of the ZIP files in the directory. If None, the directory is searched.
+
+    :return: A list with the paths of the newly extracted data files.
 
     :raises FileNotFoundError: If the path specified does not contain any ZIP files.
     :raises zipfile.BadZipFile: If an archive cannot be opened because it is not a ZIP file or is corrupted.
@@ -480,82 +958,92 @@ def extract_dwd_archives(path: str):
     marked as relevant (identified by `DATA_FILE_MARKER`). It extracts these files into the same directory as the
     ZIP file if they do not already exist there. This method helps manage data extracted from multiple sources by
     ensuring that only necessary files are unpacked, thus optimizing storage and processing time. The extraction
-    process is tracked with a progress bar for better visibility and management of the operation.
+    process is tracked with a progress bar for better visibility and management of the operation. The archives are
+    extracted in parallel threads.
     """
     # Collect all zip-files (dwd data-files)
-    zip_files: list[str] = gFunc.get_files(path, ".zip")
-    for zip_file in tqdm(zip_files, total=len(zip_files), desc="Extract DWD-Files"):
-        # open zip file
-        with zipfile.ZipFile(zip_file, 'r') as a_zip:
-            directory: str = os.path.dirname(zip_file)
-            # check if file to extract allready exist
-            for name in a_zip.namelist():
-                if DATA_FILE_MARKER.lower() in name.lower():
-                    data_filename: str = os.path.join(os.path.abspath(directory), name)
-                    if not os.path.exists(data_filename):
-                        # extract data file and break inner loop
-                        a_zip.extract(name, os.path.abspath(directory))
-                        break
+    if zip_files is None:
+        zip_files = gFunc.get_files(path, ".zip")
+    # zlib releases the GIL while decompressing - extract the archives in parallel
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        extracted_files = list(tqdm(executor.map(_extract_data_file, zip_files), total=len(zip_files),
+                                    desc="Extract DWD-Files"))
+    return [extracted_file for extracted_file in extracted_files if extracted_file]
 
 
-def _read_params(filename: str) -> List[str]:
+def _extract_data_file(zip_file: str) -> str:
     """
-    Reads the header of a text file to extract parameter names. This function assumes the parameter names are
-    located starting from the fourth column to the second last column in the header of the file.
+    Extracts the first DWD data file (identified by `DATA_FILE_MARKER`) of a ZIP archive into the directory of the
+    archive, if it does not already exist there.
 
-    :param filename: The path to the file from which to read parameter names.
+    :param zip_file: The path to the ZIP archive.
 
-    :return: A list of strings where each string is a parameter name extracted from the file header. Returns an
-             empty list if the file does not exist or the header is improperly formatted.
+    :return: The path of the extracted file or an empty string if nothing was extracted.
 
-    :raises FileNotFoundError: If the file specified does not exist.
+    :raises zipfile.BadZipFile: If the archive cannot be opened because it is not a ZIP file or is corrupted.
 
     Note:
-    The function first checks if the file exists. If it does, it opens the file and reads the first line to
-    parse out parameter names. The expected format is a semicolon-separated line where the first three columns
-    are typically reserved for station ID, measurement date, and quality number, and the following columns up
-    to the second last are parameter names. This setup is typical in data files used for meteorological or
-    environmental data collection where parameters vary per file.
+    The content is copied with a buffer of `COPY_BUFFER_SIZE` bytes, which needs far fewer read and write calls than
+    the small chunks used by `ZipFile.extract(...)`. Only the directory of the archive is read to decide if a data
+    file has to be extracted: a data file is skipped if it exists with the uncompressed size listed in the archive,
+    so already extracted archives are not decompressed again in later runs, while an incompletely extracted file is
+    replaced.
     """
-    if not os.path.exists(filename):
-        return []
-    # Read the Textfile and get station id
-    with open(filename, 'r') as content:
-        header_line = content.readline()
-        headers = header_line.split(";")
-        if len(headers) < 4:
-            return []
-        # 1. STATIONS_ID, 2. MESS_DATUM, 3. QN_*
-        # export 4. until n-1 column
-        return [name.strip() for name in headers[3:-1]]
+    directory: str = os.path.abspath(os.path.dirname(zip_file))
+    # open zip file
+    with zipfile.ZipFile(zip_file, 'r') as a_zip:
+        # check if file to extract allready exist
+        for info in a_zip.infolist():
+            if _DATA_FILE_MARKER_LOWER not in info.filename.lower():
+                continue
+            data_filename: str = os.path.join(directory, info.filename)
+            if not os.path.exists(data_filename) or os.path.getsize(data_filename) != info.file_size:
+                # extract data file and break inner loop
+                os.makedirs(os.path.dirname(data_filename), exist_ok=True)
+                with a_zip.open(info) as src, open(data_filename, "wb") as dst:
+                    shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+                return str(Path(os.path.dirname(zip_file), info.filename))
+    return ""
 
 
-def _read_id(filename: str) -> int:
+def _parse_params(header_line: str) -> List[str]:
     """
-    Extracts the station ID from the specified file. The station ID is expected to be located in the first column of
-    the second line of the file. This function is typically used for files where the first line is a header and the
-    second line begins with station data.
+    Parses the parameter names from the header line of a DWD station file (see `_read_head(...)`). This function
+    assumes the parameter names are located starting from the fourth column to the second last column.
 
-    :param filename: The path to the file from which to extract the station ID.
+    :param header_line: The header line of the file.
 
-    :return: An integer representing the station ID, or -1 if the file does not exist, the second line does not
-             contain data, or the first column of the second line cannot be converted to an integer.
+    :return: A list of strings where each string is a parameter name extracted from the header. Returns an empty list
+             if the header is empty or improperly formatted.
 
-    :raises FileNotFoundError: If the file specified does not exist.
+    Note:
+    The expected format is a semicolon-separated line where the first three columns are typically reserved for
+    station ID, measurement date, and quality number, and the following columns up to the second last are parameter
+    names. The last column is the end of row sign.
+    """
+    headers = header_line.split(";")
+    if len(headers) < 4:
+        return []
+    # 1. STATIONS_ID, 2. MESS_DATUM, 3. QN_*
+    # export 4. until n-1 column
+    return [name.strip() for name in headers[3:-1]]
+
+
+def _parse_id(first_line: str) -> int:
+    """
+    Parses the station ID from the first data line of a DWD station file (see `_read_head(...)`). The station ID is
+    expected in the first column.
+
+    :param first_line: The first line after the header of the file.
+
+    :return: An integer representing the station ID, or -1 if the line is empty or the first column cannot be
+             converted to an integer.
 
     Note:
-    This function checks the existence of the file, reads up to the second line, and attempts to parse the station ID
-    from the first column. It uses a helper function `int_def` to ensure that non-integer values or parse errors do
-    not cause a crash but instead return a default value of -1. This approach provides robustness against file read
-    errors and formatting issues.
+    It uses the helper function `int_def` to ensure that non-integer values do not cause a crash but instead return a
+    default value of -1.
     """
-    if not os.path.exists(filename):
+    # check if second line exist
+    if not first_line:
         return -1
-    # Read the Textfile and get station id
-    with open(filename, 'r') as content:
-        content.readline()
-        second_line = content.readline().strip()
-        # check if second line exist
-        if not second_line:
-            return -1
-        return gFunc.int_def(second_line.split(";")[0], -1)
+    return gFunc.int_def(first_line.split(";")[0], -1)
@@ -54,12 +54,17 @@ def filter_dataframe_by_value(df: DataFrame, col_name: str, value: float, greate
                          If False, it filters out rows where the column value is less than the specified value.
 
     :return: A DataFrame filtered according to the specified column, value, and filter type.
+
+    Note:
+    The column is compared as a numpy array, the rows are selected with the boolean array without aligning an index.
+    Missing values (NaN, pd.NA) are never selected.
     """
     _check_col_name_exist(df, col_name)
+    values = df[col_name].to_numpy(dtype=float, na_value=np.nan)
     if greater_than:
-        return df[df[col_name] >= value]
+        return df[values >= value]
     else:
-        return df[df[col_name] < value]
+        return df[values < value]
 
 
 def calc_abs_error(df: DataFrame, col_model: str, col_dwd: str) -> None:
@@ -72,10 +77,15 @@ def calc_abs_error(df: DataFrame, col_model: str, col_dwd: str) -> None:
     :param col_dwd: The name of the second column to be used in the calculation.
 
     :return: None. The function adds a new column to the DataFrame containing the absolute error.
+
+    Note:
+    Both columns belong to the same DataFrame, so they are calculated as numpy arrays without aligning the index.
+    Missing values (NaN, pd.NA) give NaN, the new column is always float.
     """
     _check_col_name_exist(df, col_model)
     _check_col_name_exist(df, col_dwd)
-    df[COL_ABS_ERROR] = abs(df[col_model] - df[col_dwd])
+    df[COL_ABS_ERROR] = np.abs(np.subtract(df[col_model].to_numpy(dtype=float, na_value=np.nan),
+                                           df[col_dwd].to_numpy(dtype=float, na_value=np.nan)))
 
 
 def get_mean_abs_error_each_station(df: DataFrame) -> DataFrame:
@@ -103,13 +113,24 @@ def get_me_mae_rmse(df: DataFrame, col_model: str, col_dwd: str) -> Tuple[float,
     :param col_dwd: The name of the column representing the observed values.
 
     :return: A tuple containing the ME, MAE, and RMSE values.
+
+    :raises ValueError: If a column contains values that are not numeric.
+
+    Note:
+    The error is calculated once as a numpy array and used for all three values. Like the pandas mean, missing values
+    (NaN, pd.NA) are ignored. If no error can be calculated, all three values are NaN.
     """
     _check_col_name_exist(df, col_model)
     _check_col_name_exist(df, col_dwd)
-    error = df[col_model] - df[col_dwd]
+    # missing values of nullable columns (pd.NA) become NaN
+    error = np.subtract(df[col_model].to_numpy(dtype=float, na_value=np.nan),
+                        df[col_dwd].to_numpy(dtype=float, na_value=np.nan))
+    error = error[~np.isnan(error)]
+    if error.size == 0:
+        return np.nan, np.nan, np.nan
     me = error.mean()
-    mae = abs(error).mean()
-    rmse = np.sqrt(np.mean(error ** 2))
+    mae = np.abs(error).mean()
+    rmse = np.sqrt(np.dot(error, error) / error.size)
     return me, mae, rmse
 
 
@@ -12,16 +12,22 @@ Contains some helpful functions.
 Functions in this module:
 ______
 - `get_files`: Searches recursively for files with a specific extension
+- `get_files_by_extensions`: Searches recursively for files with several extensions in one pass
+- `get_file_stamp`: Returns the modification time and the size of a file
 - `round_to_nearest_hour`: Rounds a given datetime object to the nearest hour
+- `round_to_nearest_hours`: Rounds all datetimes of an array to the nearest hour at once
 - `datetime_to_strf`: Converts a datetime object or a numpy.datetime64 object to a string
+- `strf_to_datetime`: Converts a string formatted as 'YYYYMMDDHH' into a datetime object
 - `hours_difference`: Calculates the absolute difference in hours between two datetime objects.
 - `int_def: Attempts` to convert a string to an integer. If the conversion fails it returns a default integer value.
 - `convert_in_0_360`: Converts an angle in degrees to a value within the range [0, 360).
 - `convert_in_180_180`: Normalizes an angle in degrees to fall within the range [-180, 180]
 """
+import os
 import pathlib
 import numpy as np
-from typing import List
+from typing import List, Tuple
+from numpy.typing import NDArray, ArrayLike
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -46,6 +52,49 @@ def get_files(look_up_path: str, extension: str) -> List[str]:
     return files
 
 
+def get_files_by_extensions(look_up_path: str, extensions: List[str]) -> dict[str, List[str]]:
+    """
+    Searches recursively for files with several extensions in a given directory and returns the full file paths
+    grouped by extension. The directory tree is only walked once for all extensions.
+
+    :param look_up_path: The directory path where the search will begin. The search is recursive, so it will include all
+           subdirectories.
+    :param extensions: A list of file extensions to search for. Include the dot (e.g., '.txt').
+
+    :return: A dictionary with each extension as key and a list of the full paths of the matching files as value.
+
+    Note:
+    This function uses `os.walk`, which reads the directory entries with `os.scandir`, so the file type is known
+    without an additional system call per file. The extensions are compared like `get_files(...)`, case-insensitive
+    on Windows and case-sensitive on other systems.
+    """
+    files: dict[str, List[str]] = {extension: [] for extension in extensions}
+    normed_extensions = [(os.path.normcase(extension), extension) for extension in extensions]
+    for root, _, filenames in os.walk(look_up_path):
+        for filename in filenames:
+            normed_filename = os.path.normcase(filename)
+            for normed_extension, extension in normed_extensions:
+                if normed_filename.endswith(normed_extension):
+                    files[extension].append(str(Path(root, filename)))
+    return files
+
+
+def get_file_stamp(filename: str) -> Tuple[int, int] | None:
+    """
+    Returns the modification time and the size of a file, a changed file gets a different stamp.
+
+    :param filename: The path to the file.
+
+    :return: A tuple with the modification time in nanoseconds and the size in bytes, or None if the file does not
+             exist.
+    """
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 def round_to_nearest_hour(date_time):
     """
     Rounds a given datetime object to the nearest hour. The function supports both Python's datetime.datetime and
@@ -82,6 +131,23 @@ def round_to_nearest_hour(date_time):
         raise TypeError("Unsupported type. Only datetime.datetime and numpy.datetime64 are supported.")
 
 
+def round_to_nearest_hours(date_times: ArrayLike) -> NDArray:
+    """
+    Rounds all datetimes of an array to the nearest hour, with the same rounding as `round_to_nearest_hour(...)`.
+
+    :param date_times: An array-like (e.g. list, numpy array or pandas Series) of datetime.datetime or numpy.datetime64
+                       objects.
+
+    :return: A numpy array with the dtype datetime64[h] and the shape of the input containing the rounded datetimes.
+
+    Note:
+    The datetimes are truncated to minutes, shifted by 30 minutes and truncated to hours. This are three integer
+    operations on the whole array instead of a Python function call for each datetime. NaT stays NaT.
+    """
+    date_times_in_minutes = np.asarray(date_times, dtype="datetime64[m]")
+    return (date_times_in_minutes + np.timedelta64(30, "m")).astype("datetime64[h]")
+
+
 def datetime_to_strf(date_time) -> str:
     """
     Converts a datetime object or a numpy.datetime64 object to a string formatted as 'YYYYMMDDHH'. This function
@@ -102,6 +168,23 @@ def datetime_to_strf(date_time) -> str:
     return date_time.strftime("%Y%m%d%H")
 
 
+def strf_to_datetime(date_str: str) -> datetime:
+    """
+    Converts a string formatted as 'YYYYMMDDHH' into a datetime object. This is the inverse of `datetime_to_strf`.
+
+    :param date_str: The string to convert, containing at least the ten digits for year, month, day and hour.
+
+    :return: A datetime object with the year, month, day and hour of the string.
+
+    :raises ValueError: If the string is too short, contains no digits at the positions or the date is invalid.
+
+    Note:
+    The fields have a fixed width, so they are converted with slicing and `int`, which is much faster than
+    `datetime.strptime`. Characters after the hour are ignored.
+    """
+    return datetime(int(date_str[0:4]), int(date_str[4:6]), int(date_str[6:8]), int(date_str[8:10]))
+
+
 def hours_difference(datetime1: datetime, datetime2: datetime) -> float:
     """
     Calculates the absolute difference in hours between two datetime objects.
@@ -13,12 +13,15 @@ the DWD (German Weather Service).
 
 import re
 import os
+import warnings
 import bz2
+import shutil
+import tempfile
 import subprocess
 import pandas as pd
 import numpy as np
 import Lib.GeneralFunctions as gFunc
-from typing import List, Tuple
+from typing import List, Tuple, Callable
 from numpy.typing import NDArray
 from pandas import DataFrame
 from datetime import datetime, timedelta
@@ -27,12 +30,11 @@ from tqdm import tqdm
 
 # wgrib2 file
 _WGRIB2_EXE: str = f"{os.path.dirname(os.path.abspath(__file__))}\\wgrib2\\wgrib2.exe"
-
-
-def split_coords(coords, n=1000):
-    """Divide the coordinate list into sublists with n coordinates each."""
-    for i in range(0, len(coords), n):
-        yield coords[i:i + n]
+# compiled patterns for the inventory output of wgrib2
+_MODEL_RE = re.compile(MODEL_PATTERN)
+_FCST_RE = re.compile(r":(\d+) min fcst::")
+# wgrib2 marks grid points without a value with 9.999e+20
+_UNDEFINED_VALUE: float = 9.999e+20
 
 
 class Grib2Datas:
@@ -78,6 +80,12 @@ class Grib2Datas:
             COL_MODEL_LATLON_DELTA: "float"
         }
         self.df_models: DataFrame = DataFrame(columns=cols).astype(datatypes)
+        # stamp (see `gFunc.get_file_stamp`) and getter for the decoded grid of each Grib2 file, created on the first
+        # access of a file and created again if the file was replaced
+        self._grid_getters: dict[str, Tuple[Tuple[int, int] | None, Callable[[NDArray], NDArray]]] = {}
+        # filename and forecast minutes of the first file in `df` for each model, param and forecast date (int64 ns),
+        # created after loading a folder
+        self._fcst_files: dict[Tuple[str, str, int], Tuple[str, int]] = {}
 
     def load_folder(self, path: str):
         """
@@ -91,8 +99,9 @@ class Grib2Datas:
 
         - The attributes `df` and `df_invalid` have the following columns at the end of the function
 
-            - `COL_MODEL` (string): Contains the name for the loaded model
-            - `COL_PARAM` (string): Contains the name for the parameter found in the Grib2 file
+            - `COL_MODEL` (string): Contains the name for the loaded model, in `df` with the dtype 'category'
+            - `COL_PARAM` (string): Contains the name for the parameter found in the Grib2 file, in `df` with the dtype
+              'category'
             - `COL_DATE` (datetime): Contains the start date of the Grib2 file
             - `COL_MODEL_FCST_MIN` (int): Contains the Forecast minutes
             - `COL_MODEL_FCST_DATE` (datetime): Contains the start date + forecast minutes
@@ -123,16 +132,33 @@ class Grib2Datas:
         grib2_files = gFunc.get_files(path, ".grib2")
         if len(grib2_files) == 0:
             raise FileNotFoundError(f"No *.grib2 Files exist in '{path}'")
+        _prefetch_files(grib2_files)
+        new_rows: List[dict] = []
         for grib2 in tqdm(grib2_files, total=len(grib2_files), desc="Loading Grib2-Files"):
-            self._load_file(os.path.abspath(grib2))
+            new_row = self._load_file(os.path.abspath(grib2))
+            if new_row is not None:
+                new_rows.append(new_row)
+        # Fill the DataFrames according to the column definition of the init function, all rows at once
+        if new_rows:
+            new_df = DataFrame(new_rows)
+            self.df = _append_rows(self.df, new_df)
+            self.df_models = _append_rows(self.df_models, new_df)
         self._date_validation()
         self.df = self.df.sort_values(by=[COL_MODEL, COL_DATE])
+        # only a few models and params - store each only once and compare them as integer codes
+        self.df[[COL_MODEL, COL_PARAM]] = self.df[[COL_MODEL, COL_PARAM]].astype("category")
+        # each requested date is found with one dict lookup instead of filtering the whole DataFrame
+        fcst_dates = self.df[COL_MODEL_FCST_DATE].to_numpy(dtype="datetime64[ns]").astype(np.int64).tolist()
+        self._fcst_files = {}
+        for key, fcst_file in zip(zip(self.df[COL_MODEL], self.df[COL_PARAM], fcst_dates),
+                                  zip(self.df[COL_MODEL_FILENAME], self.df[COL_MODEL_FCST_MIN])):
+            self._fcst_files.setdefault(key, fcst_file)
 
     def get_values(self,
                    model: str,
                    param: str,
                    date_times: datetime | List[datetime],
-                   coords: Tuple[float, float] | List[Tuple[float, float]]) -> DataFrame:
+                   coords: Tuple[float, float] | List[Tuple[float, float]] | NDArray) -> DataFrame:
         """
         Retrieves values for a specified model and parameter across given date-times and coordinates, handling both
         singular and multiple inputs for date-times and coordinates. It processes input arrays to ensure compatibility
@@ -144,7 +170,7 @@ class Grib2Datas:
         :param date_times: A datetime object or a list of datetime objects specifying the date-times for which values
         are requested.
         :param coords: A tuple of floats representing a single coordinate pair (latitude, longitude) or a list of such
-        tuples for multiple coordinates.
+        tuples for multiple coordinates. A numpy array with the shape (n, 2) is also accepted.
 
         :returns: A pandas DataFrame containing the fetched data, structured with columns for dates, forecast dates,
         forecast minutes, latitudes, longitudes, and the specified parameter values.
@@ -183,12 +209,17 @@ class Grib2Datas:
                 return arr.shape[1], arr.shape[0]
 
         def conv_to_np(data, dtype: str):
+            if isinstance(data, np.ndarray):
+                return data.astype(dtype)
             if not isinstance(data, list):
                 data = [data]
             return np.array(data, dtype=dtype)
 
         np_date_times = conv_to_np(date_times, "datetime64[s]").reshape(-1, 1)
         np_coords = conv_to_np(coords, "float64")
+        # a single coordinate pair as numpy array
+        if np_coords.ndim == 1:
+            np_coords = np_coords.reshape(1, -1)
 
         coords_width, coords_len = get_width_len(np_coords)
         date_times_width, date_times_len = get_width_len(np_date_times)
@@ -206,10 +237,9 @@ class Grib2Datas:
                                  f"Coords must be (n, 2) and 'date_times' must be (n, 1)")
 
         # Prepare vectorize functions - performance by numpy
-        np_date_round_func = np.vectorize(gFunc.round_to_nearest_hour)
         np_date_times_series = pd.Series(np_date_times.flatten())
-        # round Datetimes to nearst hour
-        np_date_times = np_date_round_func(np_date_times)
+        # round Datetimes to nearst hour - integer operations on the whole array
+        np_date_times = gFunc.round_to_nearest_hours(np_date_times)
         np_unique_datetimes = np.unique(np_date_times)
         # drop duplicates
         unique_date_times = np.unique(np_date_times)
@@ -224,66 +254,53 @@ class Grib2Datas:
 
         # define the return DataFrame
         cols = [COL_DATE, COL_MODEL_FCST_DATE, COL_MODEL_FCST_MIN, COL_LAT, COL_LON, param]
-        lat_values, lon_values, model_values, fcst_datetimes, fcst_min_values = [], [], [], [], []
         values: DataFrame = DataFrame(columns=cols)
+        num_values = len(np_date_times)
+        if num_values == 0:
+            return values
 
-        # define invalid index array - used to insert invalid values at the end
-        invalid_indexes = []
+        # one preallocated array per column - every entry is invalid until its value is found
+        fcst_datetimes = np.full(num_values, np.datetime64("NaT"), dtype="datetime64[ns]")
+        fcst_min_values = np.full(num_values, np.nan)
+        lat_values = np.full(num_values, np.nan)
+        lon_values = np.full(num_values, np.nan)
+        model_values = np.full(num_values, np.nan)
 
         for used_date, input_date in zip(unique_date_times, np_unique_datetimes):
             # Search Entry
-            founded_df = self.df[(self.df[COL_MODEL] == model) &
-                                 (self.df[COL_PARAM] == param) &
-                                 (self.df[COL_MODEL_FCST_DATE] == input_date)]
-            if founded_df.empty:
-                invalid_indexes += list(np.where(np_date_times == input_date)[0])
+            fcst_file = self._fcst_files.get((model, param, int(input_date.astype("datetime64[ns]").astype(np.int64))))
+            if fcst_file is None:
                 continue
-            filename = founded_df[COL_MODEL_FILENAME].iloc[0]
-            fcst_min = founded_df[COL_MODEL_FCST_MIN].iloc[0]
+            filename, fcst_min = fcst_file
             # get the index of date
             used_date_indexes = np.where(np_date_times == used_date)[0]
             used_coords = np_coords[used_date_indexes]
 
-            # Divide coordinates into groups of 50 and execute commands
-            res_list = []
-            for coord_grp in split_coords(used_coords, 1000):
-                # run cmd
-                command = f"{_WGRIB2_EXE} {filename} -match {param}"
-                for lat, lon in coord_grp:
-                    command += f" -lon {lon} {lat}"
-                result = subprocess.run(command, capture_output=True, text=True)
-                res_list.append(result.stdout)
-            # Evaluate result string
-            matches = re.findall(r"val=(\d+\.?\d*(e\+20)?)", ''.join(res_list))
-
-            for match, (lat, lon) in zip(matches, used_coords):
-                value: float = -1
-                if match[0] != "9.999e+20":
-                    value = float(match[0])
-                fcst_datetimes.append(used_date)
-                lat_values.append(lat)
-                lon_values.append(lon)
-                model_values.append(value)
-                fcst_min_values.append(fcst_min)
-
-        # Add invalid values
-        invalid_indexes.sort()
-        for idx in invalid_indexes:
-            fcst_datetimes.insert(idx, pd.NaT)
-            fcst_min_values.insert(idx, np.nan)
-            lat_values.insert(idx, np.nan)
-            lon_values.insert(idx, np.nan)
-            model_values.insert(idx, np.nan)
-
+            # read all values of the coordinates from the decoded grid
+            grid_values = self._get_grid_values(model, param, filename, used_coords)
+
+            # undefined grid points get -1, grid points of a file that could not be decoded stay NaN
+            date_values = np.where(grid_values >= _UNDEFINED_VALUE, -1.0, np.nan)
+            defined = grid_values < _UNDEFINED_VALUE
+            # same precision as the text output of wgrib2 (printf "%g")
+            date_values[defined] = _round_significant(grid_values[defined], 6)
+            model_values[used_date_indexes] = date_values
+            fcst_datetimes[used_date_indexes] = used_date
+            fcst_min_values[used_date_indexes] = fcst_min
+            lat_values[used_date_indexes] = used_coords[:, 0]
+            lon_values[used_date_indexes] = used_coords[:, 1]
+
+        # forecast minutes stay integers if all entries are valid
+        if not np.isnan(fcst_min_values).any():
+            fcst_min_values = fcst_min_values.astype(np.int64)
         # for Performance - fill DataFrame outside loop
-        if len(lat_values) > 0:
-            values = pd.DataFrame({COL_MODEL_FCST_DATE: fcst_datetimes,
-                                   COL_DATE: np_date_times_series,
-                                   COL_MODEL_FCST_MIN: fcst_min_values,
-                                   COL_LAT: lat_values,
-                                   COL_LON: lon_values,
-                                   param: model_values
-                                   }, columns=cols)
+        values = pd.DataFrame({COL_MODEL_FCST_DATE: fcst_datetimes,
+                               COL_DATE: np_date_times_series,
+                               COL_MODEL_FCST_MIN: fcst_min_values,
+                               COL_LAT: lat_values,
+                               COL_LON: lon_values,
+                               param: model_values
+                               }, columns=cols)
         return values
 
     def get_values_idw(self,
@@ -331,23 +348,7 @@ class Grib2Datas:
         :raises ValueError: If input dimensions or types are not as expected, or if any other input validations fail.
         """
 
-        def idw(group, dist_col, value_col, q=2):
-            # Avoid division by zero
-            group[dist_col] = np.where(group[dist_col] == 0, group[dist_col] + 1e-10, group[dist_col])
-            d = group[dist_col]
-            vals = group[value_col]
-            # Calculation of weighting
-            weighted_sum = np.sum(vals / d ** q)
-            weights_sum = np.sum(1 / d ** q)
-            # return idw values
-            return weighted_sum / weights_sum
-
-        if model == MODEL_ICON_D2:
-            delta = 0.02
-        elif model == MODEL_ICON_EU:
-            delta = 0.0625
-        else:
-            delta = 0.02
+        delta = MODEL_LAT_LON_DELTA.get(model, ICON_D2_LAT_LON_DELTA)
 
         if not isinstance(coords, list):
             coords = [coords]
@@ -369,7 +370,8 @@ class Grib2Datas:
         # Calculate idw distance and idw values
         values["idw_id"] = values.index // num_same_idw_calc
         values["distances"] = idw_distances
-        idw_values = values.groupby("idw_id").apply(idw, dist_col="distances", value_col=param)
+        idw_values = _idw(values["idw_id"].to_numpy(), values["distances"].to_numpy(dtype=float),
+                          values[param].to_numpy(dtype=float))
         # Assignment of values
         values.drop_duplicates(subset="idw_id", inplace=True)
         lats, lons = [], []
@@ -378,15 +380,58 @@ class Grib2Datas:
             lons.append(lon)
         values[COL_LAT] = lats
         values[COL_LON] = lons
-        if len(idw_values.values) == 0:
+        if len(idw_values) == 0:
             values[param] = -1
         else:
-            values[param] = idw_values.values
+            values[param] = idw_values
         # drop temporary cols
         values.reset_index(drop=True, inplace=True)
         values.drop(["idw_id", "distances"], axis=1, inplace=True)
         return values
 
+    def _get_grid_values(self, model: str, param: str, filename: str, coords: NDArray) -> NDArray:
+        """
+        Reads the values of the grid points closest to the given coordinates from a Grib2 file.
+
+        The Grib2 files of the DWD contain a regular latitude-longitude grid. On the first access of a file the grid
+        is decoded and a getter with the fixed grid description (start, increment and size from `df_models`) is
+        created, every following request only needs the index calculation and an array access. If the modification
+        time or the size of the file has changed since, the grid is decoded again.
+
+        :param model: The model name as a string, used to find the grid description in `df_models`.
+        :param param: The parameter name as a string, which is read from the Grib2 file.
+        :param filename: The path to the Grib2 file that contains the parameter.
+        :param coords: A numpy array with the shape (n, 2) containing latitude and longitude in the range of 0 to 360
+        degree.
+
+        :return: A numpy array with n values. Coordinates outside the grid get the value 9.999e+20 (undefined), all
+        values of a file that could not be decoded are NaN (see `_read_grid(...)`).
+
+        Note:
+        The grid index is rounded to the closest grid point, the same point that wgrib2 uses for its option '-lon'.
+        """
+        if len(coords) == 0:
+            return np.full(0, _UNDEFINED_VALUE)
+        stamp = gFunc.get_file_stamp(filename)
+        stamp_getter = self._grid_getters.get(filename)
+        if stamp_getter is not None and stamp_getter[0] == stamp:
+            grid_getter = stamp_getter[1]
+        else:
+            model_info = self.df_models[(self.df_models[COL_MODEL] == model) & (self.df_models[COL_PARAM] == param)]
+            if model_info.empty:
+                return np.full(len(coords), _UNDEFINED_VALUE)
+            delta = float(model_info[COL_MODEL_LATLON_DELTA].iloc[0])
+            lat_start = float(model_info[COL_MODEL_LAT_START].iloc[0])
+            lat_end = float(model_info[COL_MODEL_LAT_END].iloc[0])
+            lon_start = gFunc.convert_in_0_360(float(model_info[COL_MODEL_LON_START].iloc[0]))
+            lon_end = gFunc.convert_in_0_360(float(model_info[COL_MODEL_LON_END].iloc[0]))
+            num_lats = int(round((lat_end - lat_start) / delta)) + 1
+            num_lons = int(round(((lon_end - lon_start) % 360) / delta)) + 1
+            grid = _read_grid(filename, param, num_lats, num_lons)
+            grid_getter = _make_grid_getter(grid, lat_start, lon_start, delta)
+            self._grid_getters[filename] = (stamp, grid_getter)
+        return grid_getter(coords)
+
     def _get_closest_date(self, date_time: datetime) -> datetime:
         """
         Finds and returns the date-time in the dataframe closest to the specified date-time.
@@ -432,43 +477,45 @@ class Grib2Datas:
         self.df = self.df[self.df[COL_MODEL_FCST_MIN] <= 120]
         self.df_models = self.df_models.drop_duplicates()
 
-    def _load_file(self, filename: str):
+    def _load_file(self, filename: str) -> dict | None:
         """
-        Processes a single weather forecast file, extracting and storing relevant forecast data.
+        Processes a single weather forecast file, extracting the relevant forecast data.
 
         This internal method executes a command using the wgrib2 tool to read data from a given weather forecast file
         (typically .grib2 format). It parses the command's output to extract forecast data, including dates, forecast
-        minutes, model parameters, and coordinates. The extracted data is then added as a new row to the class's main
+        minutes, model parameters, and coordinates. The extracted data is returned as a new row for the class's main
         dataframe and the model-specific dataframe.
 
         :param filename: The path to the .grib2 file to be processed.
 
+        :return: A dict with the extracted data for the columns of `self.df` and `self.df_models`, or None if the
+                 output of wgrib2 does not contain a lat-lon grid.
+
         - Extracts forecast information from the file, including the forecast model, date, forecast minutes,
           and geographic coordinates
-        - Adds a new row with the extracted data to both `self.df` and `self.df_models` dataframes
 
         Note:
         This method assumes the presence of a predefined pattern (PATTERN) to parse the command output and relies
-        on the wgrib2 command-line tool. The method updates class dataframes directly, adding new entries for each
-        processed file.
+        on the wgrib2 command-line tool. The dataframes are not changed, `load_folder(...)` appends the rows of all
+        files at once.
         """
 
         command: str = f"{_WGRIB2_EXE} {filename} -s -grid"
         result = subprocess.run(command, capture_output=True, text=True)
         if LAT_LON in result.stdout:
-            match = re.search(MODEL_PATTERN, result.stdout)
+            match = _MODEL_RE.search(result.stdout)
             if match:
                 # index 0 = full match of complete string
-                date: datetime = datetime.strptime(match.group(1), "%Y%m%d%H")
+                date: datetime = gFunc.strf_to_datetime(match.group(1))
                 # if not found, then None
-                submatch = re.search(r":(\d+) min fcst::", result.stdout)
+                submatch = _FCST_RE.search(result.stdout)
                 if submatch:
                     fcst_minutes = int(submatch.group(1))
                     fcst_date = date + timedelta(minutes=fcst_minutes)
                 else:
                     fcst_minutes = 0
                     fcst_date = date
-                new_row = {
+                return {
                     COL_MODEL: _get_model(float(match.group(5))),
                     COL_DATE: date,
                     COL_MODEL_FCST_MIN: fcst_minutes,
@@ -481,9 +528,63 @@ class Grib2Datas:
                     COL_MODEL_LON_END: gFunc.convert_in_180_180(float(match.group(7))),
                     COL_MODEL_FILENAME: filename
                 }
-                # Fill the DataFrames according to the column definition of the init function.
-                self.df.loc[len(self.df)] = new_row
-                self.df_models.loc[len(self.df_models)] = new_row
+        return None
+
+
+def _idw(idw_ids: NDArray, distances: NDArray, values: NDArray, q: int = 2) -> NDArray:
+    """
+    Calculates the inverse distance weighting (IDW) of all groups of values at once.
+
+    :param idw_ids: A numpy array with the group of each value, the groups are numbered from 0 without gaps.
+    :param distances: A numpy array with the distance of each value to the searched position.
+    :param values: A numpy array with the values.
+    :param q: The power of the distances. Defaults to 2.
+
+    :return: A numpy array with the IDW value of each group, in the order of the group numbers.
+
+    Note:
+    The weighted values and the weights are summed up per group with `np.bincount`, instead of calling a Python
+    function for each group. A distance of 0 is replaced by 1e-10 to avoid a division by zero. Missing values are
+    not added to the weighted sum, but their weights are part of the sum of the weights.
+    """
+    powered_distances = np.where(distances == 0, 1e-10, distances) ** q
+    weights = 1 / powered_distances
+    weighted_values = np.nan_to_num(values / powered_distances, nan=0.0)
+    return np.bincount(idw_ids, weights=weighted_values) / np.bincount(idw_ids, weights=weights)
+
+
+def _round_significant(values: NDArray, digits: int) -> NDArray:
+    """
+    Rounds all values to a number of significant digits at once.
+
+    :param values: A numpy array with finite values.
+    :param digits: The number of significant digits.
+
+    :return: A numpy array with the rounded values.
+
+    Note:
+    Each value is scaled by a power of ten so that the requested digits are in front of the decimal point, rounded
+    with `np.round` and scaled back. With 6 digits the result is the same as formatting each value with "%g" and
+    parsing the text again, without a Python call per value.
+    """
+    magnitudes = np.floor(np.log10(np.abs(values), out=np.zeros_like(values, dtype=float), where=values != 0))
+    scales = 10.0 ** (digits - 1 - magnitudes)
+    return np.round(values * scales) / scales
+
+
+def _append_rows(df: DataFrame, new_rows: DataFrame) -> DataFrame:
+    """
+    Appends new rows to a DataFrame with a single concatenation, only the columns of the DataFrame are used.
+
+    :param df: The DataFrame with the column definition (names and order).
+    :param new_rows: A DataFrame with the new rows, it can contain additional columns.
+
+    :return: A new DataFrame with the rows of both DataFrames.
+    """
+    new_rows = new_rows[df.columns]
+    if df.empty:
+        return new_rows.reset_index(drop=True)
+    return pd.concat([df, new_rows], ignore_index=True)
 
 
 def _create_coords_in_radius(lat: float,
@@ -526,6 +627,86 @@ def _create_coords_in_radius(lat: float,
     return points, distances
 
 
+def _read_grid(filename: str, param: str, num_lats: int, num_lons: int) -> NDArray:
+    """
+    Decodes the complete grid of a parameter from a Grib2 file.
+
+    This internal method uses wgrib2 to write the values of the first message matching the parameter into a
+    temporary binary file (float32 without header). The order of the values is west to east and south to north,
+    so the returned array is indexed with [latitude index, longitude index].
+
+    :param filename: The path to the Grib2 file.
+    :param param: The parameter name as a string, which is used for the wgrib2 option '-match'.
+    :param num_lats: The number of grid points in latitude direction.
+    :param num_lons: The number of grid points in longitude direction.
+
+    :return: A numpy array with the shape (num_lats, num_lons). If wgrib2 fails or the number of values does not fit
+    the grid, a warning with the file name and the parameter is issued and all values are NaN (no value).
+
+    :raises FileNotFoundError: If the wgrib2 executable does not exist.
+
+    Note:
+    The arguments are passed as a list, so file names with spaces are not split. A failed file is not hidden behind
+    regular values: NaN is not converted into the undefined value (-1) by `get_values(...)`.
+    """
+    tmp_handle, tmp_filename = tempfile.mkstemp(suffix=".bin")
+    os.close(tmp_handle)
+    try:
+        command = [_WGRIB2_EXE, filename, "-match", param, "-end", "-order", "we:sn", "-no_header",
+                   "-bin", tmp_filename]
+        result = subprocess.run(command, capture_output=True, text=True)
+        grid = np.fromfile(tmp_filename, dtype="<f4")
+    finally:
+        os.remove(tmp_filename)
+    if result.returncode != 0:
+        warnings.warn(f"wgrib2 could not decode the parameter '{param}' of the file '{filename}' "
+                      f"(return code {result.returncode}): {result.stderr.strip()}")
+        return np.full((num_lats, num_lons), np.nan)
+    if grid.size != num_lats * num_lons:
+        warnings.warn(f"The parameter '{param}' of the file '{filename}' contains {grid.size} values, but the grid "
+                      f"has {num_lats * num_lons} points ({num_lats} x {num_lons}).")
+        return np.full((num_lats, num_lons), np.nan)
+    # the undefined value is not exact as float32, set it back to the float64 value
+    grid = grid.astype(np.float64)
+    grid[np.isclose(grid, _UNDEFINED_VALUE)] = _UNDEFINED_VALUE
+    return grid.reshape(num_lats, num_lons)
+
+
+def _make_grid_getter(grid: NDArray,
+                      lat_start: float,
+                      lon_start: float,
+                      delta: float) -> Callable[[NDArray], NDArray]:
+    """
+    Creates a function that returns the values of the grid points closest to the given coordinates.
+
+    The grid description is fixed for a Grib2 file, so it is bound once in the returned closure instead of being
+    looked up again for each request.
+
+    :param grid: A numpy array with the shape (number of latitudes, number of longitudes), ordered south to north
+    and west to east.
+    :param lat_start: The latitude of the first grid point in degree.
+    :param lon_start: The longitude of the first grid point in the range of 0 to 360 degree.
+    :param delta: The grid spacing in degree.
+
+    :return: A function that takes a numpy array with the shape (n, 2) containing latitude and longitude (0 to 360
+    degree) and returns a numpy array with n values. Coordinates outside the grid get the value 9.999e+20.
+    """
+    num_lats, num_lons = grid.shape
+
+    def get_values(coords: NDArray) -> NDArray:
+        # latitudes were converted into 0 to 360 degree - southern latitudes are greater than 180 degree
+        lats = np.where(coords[:, 0] > 180, coords[:, 0] - 360, coords[:, 0])
+        lat_indexes = np.rint((lats - lat_start) / delta).astype(int)
+        lon_indexes = np.rint(((coords[:, 1] - lon_start) % 360) / delta).astype(int)
+        in_grid = (lat_indexes >= 0) & (lat_indexes < num_lats) & (lon_indexes >= 0) & (lon_indexes < num_lons)
+
+        values = np.full(len(coords), _UNDEFINED_VALUE)
+        values[in_grid] = grid[lat_indexes[in_grid], lon_indexes[in_grid]]
+        return values
+
+    return get_values
+
+
 def _get_model(delta: float) -> str:
     """
     Determines the weather forecast model based on the specified delta value.
@@ -541,12 +722,41 @@ def _get_model(delta: float) -> str:
     The method currently supports specific delta values for predefined models. Other delta values will default
     to a known 'unknown' model identifier.
     """
-    if delta == 0.02:
-        return MODEL_ICON_D2
-    elif delta == 0.0625:
-        return MODEL_ICON_EU
-    else:
-        return MODEL_UNKNOWN
+    for model, model_delta in MODEL_LAT_LON_DELTA.items():
+        if delta == model_delta:
+            return model
+    return MODEL_UNKNOWN
+
+
+def _prefetch_files(filenames: List[str]):
+    """
+    Advises the operating system to read the given files into the page cache in the background.
+
+    The files are processed one after the other by wgrib2. Announcing all files in advance allows the kernel to
+    load the next files while the current file is being decoded, so the disk access time is hidden behind the
+    decoding time of wgrib2.
+
+    :param filenames: A list of strings, where each string is a file path to a file that will be read soon.
+
+    :return: None. The method only sends a hint to the operating system and does not read any data itself.
+
+    Note:
+    The hint is only available on POSIX systems (`os.posix_fadvise`). On other systems (e.g. Windows) the function
+    does nothing. Files that cannot be opened are skipped, the error is raised later when the file is really read.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for filename in filenames:
+        try:
+            fd = os.open(filename, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
 
 
 def _extract_bz2_archives(bz2_archives: List[str]):
@@ -576,5 +786,4 @@ def _extract_bz2_archives(bz2_archives: List[str]):
         extracted_path: str = os.path.join(directory, filename_body)
         if not os.path.exists(extracted_path):
             with open(extracted_path, "wb") as extracted_file, bz2.BZ2File(archive, "rb") as archiv:
-                for content in archiv:
-                    extracted_file.write(content)
+                shutil.copyfileobj(archiv, extracted_file, COPY_BUFFER_SIZE)
@@ -75,17 +75,26 @@ def download_data(download_list: List[DownloadData]):
     :param download_list: A list of DownloadData instances specifying the files to be downloaded.
 
     Note:
-    This function skips any DownloadData instance where the URL is an empty string.
+    This function skips any DownloadData instance where the URL is an empty string or where the target file
+    already exists. The files of the DWD contain the date and the forecast step in their names, so an existing file
+    has the same content and does not need to be transferred again. The content is first written to a temporary file
+    (target path + '.part') that is renamed to the target path after the complete content was written, so an
+    interrupted download never leaves an incomplete target file that would be skipped.
     If a download attempt fails (e.g., if the server returns a non-200 status code),
     an error message will be printed indicating that the download could not be completed.
     """
     for data in tqdm(download_list, total=len(download_list), desc="Downloading files"):
         if data.url == "":
             continue
+        # file already downloaded - skip the transfer
+        if os.path.exists(data.target_path):
+            continue
         response = requests.get(data.url)
         if response.status_code == 200:
-            with open(data.target_path, 'wb') as content:
+            part_path = data.target_path + ".part"
+            with open(part_path, 'wb') as content:
                 content.write(response.content)
+            os.replace(part_path, data.target_path)
         else:
             print(f"Error downloading the file {data.url}. "
                   f"The file may no longer exist. Response code: {response.status_code}")
@@ -22,6 +22,12 @@ INIT_FILE_HOURLY_MARKER: str = "Stundenwerte_Beschreibung"
 INIT_FILE_10_MIN_MARKER: str = "zehn_min_sd_Beschreibung"
 DATA_FILE_MARKER: str = "produkt_"
 
+# Buffer size for copying extracted archive content (1 MiB)
+COPY_BUFFER_SIZE: int = 1024 * 1024
+
+# Extension of the cache files with the already parsed content of the DWD files
+DWD_CACHE_EXTENSION: str = ".cache.npz"
+
 # Export/Import filenames
 CSV_NAME_ICON_D2: str = "data_ICON-D2.csv"
 CSV_NAME_ICON_EU: str = "data_ICON-EU.csv"
@@ -75,3 +81,9 @@ ICON_D2_LAT_MAX: float = 58.08
 ICON_D2_LON_MIN: float = 356.06 - 360  # Prime meridian reference
 ICON_D2_LON_MAX: float = 20.34
 ICON_D2_LAT_LON_DELTA: float = 0.02
+
+# Grid spacing of the models - one lookup instead of branching over the model name
+MODEL_LAT_LON_DELTA: dict[str, float] = {
+    MODEL_ICON_D2: ICON_D2_LAT_LON_DELTA,
+    MODEL_ICON_EU: ICON_EU_LAT_LON_DELTA,
+}
@@ -20,14 +20,15 @@ import re
 import os
 import Lib.HtmlGrabbler as htmlGrab
 from typing import List
+from Lib.IOConsts import MODEL_ICON_D2, MODEL_ICON_EU
 
 
-# local consts
-MAIN_URL_ICON_D2 = "https://opendata.dwd.de/weather/nwp/icon-d2/grib/"
-MAIN_URL_ICON_EU = "https://opendata.dwd.de/weather/nwp/icon-eu/grib/"
+# local consts - the model names are taken from IOConsts, so that both spellings cannot drift apart
+HTML_ICON_D2 = MODEL_ICON_D2.lower()
+HTML_ICON_EU = MODEL_ICON_EU.lower()
+MAIN_URL_ICON_D2 = f"https://opendata.dwd.de/weather/nwp/{HTML_ICON_D2}/grib/"
+MAIN_URL_ICON_EU = f"https://opendata.dwd.de/weather/nwp/{HTML_ICON_EU}/grib/"
 HTML_CLOUD_COVER_TOTAL = "clct/"
-HTML_ICON_D2 = "icon-d2"
-HTML_ICON_EU = "icon-eu"
 
 
 def _create_modeldata(url: str, file: str, target_path: str) -> htmlGrab.DownloadData:
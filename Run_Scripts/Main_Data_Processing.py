@@ -86,23 +86,18 @@ def combine_datas(dwd_datas: DWDStations,
     Note: The function assumes that `Date_UTC` and `Date_Fcst` columns in model data contain forecast datetimes
           and are identical, and it uses these along with latitude and longitude for merging datasets.
     """
-    coords = dwd_datas.get_station_locations()
-    coords_list = list(zip(coords[COL_LAT], coords[COL_LON]))
+    coords = dwd_datas.get_station_coords()
     model_dates = model_datas.df[COL_MODEL_FCST_DATE].tolist()
 
     if use_all_params:
         dwd_param_list = None
 
-    temp_dfs = []
-    for lat, lon in tqdm(coords_list, total=len(coords_list), desc="Processing DWD-Values"):
-        temp_df = dwd_datas.get_values(model_dates, lat, lon, use_all_params, dwd_param_list)
-        temp_df.dropna(axis=1, how="all", inplace=True)
-        temp_dfs.append(temp_df)
-    vals_dwd = pd.concat(temp_dfs, ignore_index=True)
+    # the dates are rounded only once for all stations
+    vals_dwd = dwd_datas.get_values_many(model_dates, coords, use_all_params, dwd_param_list)
 
-    temp_dfs.clear()
+    temp_dfs = []
     for date in tqdm(model_dates, total=len(model_dates), desc="Processing Model-Values"):
-        temp_df = model_datas.get_values(model_str, model_param, date, coords_list)
+        temp_df = model_datas.get_values(model_str, model_param, date, coords)
         temp_df.dropna(axis=1, how="all", inplace=True)
         temp_dfs.append(temp_df)
     vals_model = pd.concat(temp_dfs, ignore_index=True)
@@ -248,8 +243,8 @@ def data_postprocessing(df: DataFrame) -> DataFrame:
     if "V_N" in df.columns:
         # convert -1 in V_N to 8/8 Cloud Coverage because it is fog
         df["V_N"].replace(-1, 8, inplace=True)
-        # recalc in percentage [-] -> [%]
-        df["V_N"] = df["V_N"] / 8 * 100
+        # recalc in percentage [-] -> [%], one multiplication: 100 / 8 = 12.5 (exact, same result as / 8 * 100)
+        df["V_N"] = df["V_N"] * 12.5
 
     return df
 
@@ -380,7 +375,8 @@ dwd_params = ["V_N", "V_N_I"]
 # init dwd txt files
 print(f"~~~ Loading - DWD Stations ~~~")
 dwds = DWDStations()
-dwds.load_folder(dwd_path)
+# the recording periods are not used - skip reading the first and last line of each file
+dwds.load_folder(dwd_path, exact_dates=False)
 
 # check if target directory exist
 if not os.path.exists(f"datas"):
@@ -390,7 +386,7 @@ if not os.path.exists(f"datas"):
 if os.path.exists(f"datas\\radiationStations.pkl"):
     print(f"~~~ Processing - DWD Solarstations ~~~")
     dwd_solar = DWDStations()
-    dwd_solar.load_folder(os.path.join(dwd_path, "solar"))
+    dwd_solar.load_folder(os.path.join(dwd_path, "solar"), exact_dates=False)
     export_solar_dwd = dwd_solar.df[[COL_STATION_ID, COL_LAT, COL_LON]].drop_duplicates(COL_STATION_ID)
     useful_solar_station = load_pkl(f"datas\\radiationStations.pkl")
     filter_mask = export_solar_dwd[COL_STATION_ID].isin(useful_solar_station.iloc[:, 0])
@@ -403,12 +399,9 @@ for model in models:
     print(f"~~~ Processing - {model} ~~~")
     exportname: str = f"data_{model}.csv"
     grib2_path: str = f"..\\Run_Scripts\\WeatherData\\{model.lower()}"
-    if model == MODEL_ICON_D2:
-        model_delta: float = ICON_D2_LAT_LON_DELTA
-    elif model == MODEL_ICON_EU:
-        model_delta: float = ICON_EU_LAT_LON_DELTA
-    else:
+    if model not in MODEL_LAT_LON_DELTA:
         raise ValueError("Unsupported Model. Only 'ICON-D2' and 'ICON-EU' are supported.")
+    model_delta: float = MODEL_LAT_LON_DELTA[model]
 
     # init grib2 files
     grib2_datas = Grib2Datas()
@@ -1,8 +1,11 @@
 import os
+import shutil
+import tempfile
 import unittest
 import _Tests.testConsts as tc
 from datetime import datetime
-from Lib.DWDStationReader import DWDStations, CorruptedInitFileError
+from Lib.DWDStationReader import DWDStations, CorruptedInitFileError, read_file_to_df, extract_dwd_archives, \
+    _read_sorted_file_df
 from Lib.IOConsts import *
 
 
@@ -32,6 +35,11 @@ class TestDWDStations(unittest.TestCase):
         self.assertTrue(91 in dwds.df[COL_STATION_ID].values)
         self.assertTrue(dwds.df.loc[dwds.df[COL_STATION_ID] == 96, COL_DWD_LOADED].iloc[0])
         self.assertFalse(dwds.df.loc[dwds.df[COL_STATION_ID] == 91, COL_DWD_LOADED].iloc[0])
+        # loading without the dates of the files keeps the dates of the init file
+        dwds = DWDStations()
+        dwds.load_folder(tc.TEST_DIR_DWD, exact_dates=False)
+        self.assertTrue(dwds.df.loc[dwds.df[COL_STATION_ID] == 96, COL_DWD_LOADED].iloc[0])
+        self.assertEqual(datetime(2019, 4, 9), dwds.df.loc[dwds.df[COL_STATION_ID] == 96, COL_DATE_START].iloc[0])
 
     def test_get_values(self):
         dwds = DWDStations()
@@ -66,3 +74,96 @@ class TestDWDStations(unittest.TestCase):
         value = int(value_df["V_N"].iloc[0])
         self.assertEqual(5, value)
 
+    def test_get_values_many(self):
+        dwds = DWDStations()
+        dwds.load_folder(tc.TEST_DIR_DWD)
+        # invalid lat lon
+        self.assertEqual(0, len(dwds.get_values_many(datetime(2022, 8, 4, 1), [(90, 0)], False, ["V_N"])))
+        # only station 96 is loaded, station 91 and invalid locations are skipped
+        value_df = dwds.get_values_many([datetime(2022, 8, 4, 1), datetime(2022, 8, 4, 3)],
+                                        [(52.9437, 12.8518), (50.7446, 9.3450), (90, 0)],
+                                        False,
+                                        ["V_N"])
+        self.assertEqual(2, len(value_df))
+        self.assertEqual(5, int(value_df["V_N"].iloc[0]))
+        self.assertEqual(8, int(value_df["V_N"].iloc[1]))
+        # same values as a single request
+        value_df = dwds.get_values_many(datetime(2022, 8, 4, 1), dwds.get_station_coords(), True)
+        self.assertTrue(value_df.equals(dwds.get_values(datetime(2022, 8, 4, 1), 52.9437, 12.8518, True)))
+
+    def test_get_nearest_stations(self):
+        dwds = DWDStations()
+        # nothing loaded
+        self.assertEqual(0, len(dwds.get_nearest_stations((52.9, 12.8))))
+        dwds.load_folder(tc.TEST_DIR_DWD)
+        # only station 96 is loaded
+        nearest_df = dwds.get_nearest_stations([(52.9, 12.8), (50.7446, 9.3450)])
+        self.assertEqual(2, len(nearest_df))
+        self.assertAlmostEqual(52.9437, nearest_df[COL_LAT].iloc[0])
+        self.assertAlmostEqual(12.8518, nearest_df[COL_LON].iloc[1])
+        # location can be used to read values
+        value_df = dwds.get_values(datetime(2022, 8, 4, 1),
+                                   nearest_df[COL_LAT].iloc[0],
+                                   nearest_df[COL_LON].iloc[0],
+                                   False,
+                                   ["V_N"])
+        self.assertEqual(5, int(value_df["V_N"].iloc[0]))
+
+    def test_get_station_coords(self):
+        dwds = DWDStations()
+        dwds.load_folder(tc.TEST_DIR_DWD)
+        coords = dwds.get_station_coords()
+        self.assertEqual((2, 2), coords.shape)
+        self.assertTrue((dwds.get_station_locations().to_numpy() == coords).all())
+
+    def test_load_values(self):
+        dwds = DWDStations()
+        # nothing loaded
+        dwds.load_values()
+        dwds.load_folder(tc.TEST_DIR_DWD)
+        dwds.load_values()
+        value_df = dwds.get_values([datetime(2022, 8, 4, 1), datetime(2022, 8, 4, 3)], 52.9437, 12.8518, False,
+                                   ["V_N"])
+        self.assertEqual(2, len(value_df))
+        self.assertEqual(8, int(value_df["V_N"].iloc[1]))
+
+    def test_read_sorted_file_df_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = shutil.copy(f"{tc.TEST_DIR_DWD}\\produkt_p0_stunde_20220804_20240204_00096.txt", tmp_dir)
+            cache_filename = filename + DWD_CACHE_EXTENSION
+            df_file = _read_sorted_file_df(filename, True)
+            self.assertTrue(os.path.exists(cache_filename))
+            # only the cache file was added to the directory, no temporary file remains
+            self.assertEqual(2, len(os.listdir(tmp_dir)))
+            # loaded from the cache file
+            self.assertTrue(df_file.equals(_read_sorted_file_df(filename, True)))
+            # invalid cache file - the file is read again and the cache file is replaced
+            with open(cache_filename, "wb") as content:
+                content.write(b"invalid")
+            self.assertTrue(df_file.equals(_read_sorted_file_df(filename, True)))
+            self.assertTrue(df_file.equals(_read_sorted_file_df(filename, True)))
+
+    def test_read_file_to_df(self):
+        df = read_file_to_df(f"{tc.TEST_DIR_DWD}\\produkt_p0_stunde_20220804_20240204_00096.txt")
+        self.assertEqual("datetime64[ns]", df[COL_DATE].dtype)
+        self.assertEqual(datetime(2022, 8, 4), df[COL_DATE].iloc[0])
+        self.assertEqual(object, df[COL_STATION_ID].dtype)
+        self.assertNotIn("eor", df.columns)
+        # text values are stripped
+        self.assertFalse(df[COL_STATION_ID].str.contains(" ").any())
+
+    def test_extract_dwd_archives(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            zip_file = shutil.copy(f"{tc.TEST_DIR_DWD}\\produkt_n_stunde_20220804_20240204_00096.zip", tmp_dir)
+            data_filename = os.path.join(tmp_dir, "produkt_n_stunde_20220804_20240204_00096.txt")
+            self.assertEqual([data_filename], extract_dwd_archives(tmp_dir, [zip_file]))
+            size = os.path.getsize(data_filename)
+            # already extracted
+            self.assertEqual([], extract_dwd_archives(tmp_dir, [zip_file]))
+            # incompletely extracted file is extracted again
+            with open(data_filename, "r+b") as content:
+                content.truncate(10)
+            self.assertEqual([data_filename], extract_dwd_archives(tmp_dir, [zip_file]))
+            self.assertEqual(size, os.path.getsize(data_filename))
+            # no other files are written next to the archive
+            self.assertEqual(2, len(os.listdir(tmp_dir)))
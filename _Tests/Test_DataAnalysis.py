@@ -0,0 +1,52 @@
+import unittest
+import numpy as np
+import pandas as pd
+import Lib.DataAnalysis as da
+from pandas import DataFrame
+from Lib.IOConsts import *
+
+
+class TestDataAnalysis(unittest.TestCase):
+    def test_filter_dataframe_by_value(self):
+        df = DataFrame({"value": pd.array([1.5, pd.NA, 3.0, 2.0], dtype="Float64"),
+                        "count": pd.array([1, 2, pd.NA, 4], dtype="Int64")})
+        self.assertEqual([2, 3], da.filter_dataframe_by_value(df, "value", 2.0).index.tolist())
+        self.assertEqual([0], da.filter_dataframe_by_value(df, "value", 2.0, False).index.tolist())
+        # rows with missing values are filtered out in both cases
+        self.assertEqual([1, 3], da.filter_dataframe_by_value(df, "count", 2).index.tolist())
+        self.assertEqual([0], da.filter_dataframe_by_value(df, "count", 2, False).index.tolist())
+        # invalid column
+        self.assertRaises(ValueError, da.filter_dataframe_by_value, df, "Dummy", 2.0)
+
+    def test_get_me_mae_rmse(self):
+        df = DataFrame({"model": [1.0, 4.0, 2.0], "dwd": [2.0, 2.0, 2.0]})
+        me, mae, rmse = da.get_me_mae_rmse(df, "model", "dwd")
+        self.assertAlmostEqual(1 / 3, me)
+        self.assertAlmostEqual(1.0, mae)
+        self.assertAlmostEqual(np.sqrt(5 / 3), rmse)
+        # invalid column
+        self.assertRaises(ValueError, da.get_me_mae_rmse, df, "model", "Dummy")
+
+    def test_get_me_mae_rmse_missing_values(self):
+        # missing values are ignored - NaN, pd.NA of nullable columns and mixed object columns
+        df = DataFrame({"model": pd.array([1, 4, None, 3], dtype="Int64"),
+                        "dwd": pd.Series([2.0, 2.0, 2.0, np.nan]),
+                        "dwd_object": pd.Series([2, 2, pd.NA, None], dtype=object)})
+        self.assertEqual((0.5, 1.5, np.sqrt(2.5)), da.get_me_mae_rmse(df, "model", "dwd"))
+        self.assertEqual((0.5, 1.5, np.sqrt(2.5)), da.get_me_mae_rmse(df, "model", "dwd_object"))
+        # no valid value
+        df = DataFrame({"model": [np.nan, np.nan], "dwd": pd.array([None, None], dtype="Float64")})
+        self.assertTrue(np.isnan(da.get_me_mae_rmse(df, "model", "dwd")).all())
+        # values that are not numeric are not ignored
+        df = DataFrame({"model": [1.0, 2.0], "dwd": ["2.0", "x"]})
+        self.assertRaises(ValueError, da.get_me_mae_rmse, df, "model", "dwd")
+
+    def test_calc_abs_error(self):
+        df = DataFrame({"model": pd.array([1, 4, None], dtype="Int64"),
+                        "dwd": pd.array([2.0, 2.0, 2.0], dtype="Float64")})
+        da.calc_abs_error(df, "model", "dwd")
+        self.assertEqual(float, df[COL_ABS_ERROR].dtype)
+        self.assertEqual([1.0, 2.0], df[COL_ABS_ERROR].iloc[:2].tolist())
+        self.assertTrue(np.isnan(df[COL_ABS_ERROR].iloc[2]))
+        # the result can be filtered
+        self.assertEqual([1], da.filter_dataframe_by_value(df, COL_ABS_ERROR, 1.5).index.tolist())
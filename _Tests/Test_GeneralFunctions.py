@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 import numpy as np
 import Lib.GeneralFunctions as gFunc
@@ -10,6 +12,25 @@ class TestGeneralFunctions(unittest.TestCase):
         self.assertEqual(0, len(gFunc.get_files(tc.TEST_DIR_EMPTY, ".txt")))
         self.assertEqual(1, len(gFunc.get_files(tc.TEST_DIR_DWD_WITHOUT_INIT_FILE, ".txt")))
 
+    def test_get_files_by_extensions(self):
+        files = gFunc.get_files_by_extensions(tc.TEST_DIR_DWD_WITHOUT_INIT_FILE, [".txt", ".zip"])
+        self.assertEqual(1, len(files[".txt"]))
+        self.assertEqual(0, len(files[".zip"]))
+        self.assertEqual(gFunc.get_files(tc.TEST_DIR_DWD_WITHOUT_INIT_FILE, ".txt"), files[".txt"])
+
+    def test_get_file_stamp(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "file.txt")
+            self.assertIsNone(gFunc.get_file_stamp(filename))
+            with open(filename, "wb") as content:
+                content.write(b"content")
+            stamp = gFunc.get_file_stamp(filename)
+            self.assertEqual(7, stamp[1])
+            self.assertEqual(stamp, gFunc.get_file_stamp(filename))
+            with open(filename, "ab") as content:
+                content.write(b"!")
+            self.assertNotEqual(stamp, gFunc.get_file_stamp(filename))
+
     def test_round_to_nearest_hour(self):
         self.assertEqual(gFunc.round_to_nearest_hour(datetime(2023, 12, 27, 10, 27)),
                          datetime(2023, 12, 27, 10))
@@ -21,6 +42,15 @@ class TestGeneralFunctions(unittest.TestCase):
                          np.datetime64("2023-12-27T10", "h"))
         self.assertRaises(TypeError, gFunc.round_to_nearest_hour, "2023.12.27 9:38")
 
+    def test_round_to_nearest_hours(self):
+        rounded = gFunc.round_to_nearest_hours([datetime(2023, 12, 27, 10, 27),
+                                                np.datetime64("2023-12-27T09:38:00"),
+                                                datetime(2023, 12, 27, 9, 29, 59)])
+        self.assertEqual(np.dtype("datetime64[h]"), rounded.dtype)
+        self.assertEqual(np.datetime64("2023-12-27T10", "h"), rounded[0])
+        self.assertEqual(np.datetime64("2023-12-27T10", "h"), rounded[1])
+        self.assertEqual(np.datetime64("2023-12-27T09", "h"), rounded[2])
+
     def test_hours_difference(self):
         date1: datetime = datetime(2023, 12, 27, 10, 0)
         date2: datetime = datetime(2023, 12, 27, 6, 30)
@@ -33,6 +63,12 @@ class TestGeneralFunctions(unittest.TestCase):
         self.assertEqual("2023122710",
                          gFunc.datetime_to_strf(np.datetime64("2023-12-27T10:27:00")))
 
+    def test_strf_to_datetime(self):
+        self.assertEqual(datetime(2023, 12, 27, 10), gFunc.strf_to_datetime("2023122710"))
+        self.assertEqual(datetime(2023, 12, 27, 10), gFunc.strf_to_datetime("202312271000"))
+        self.assertRaises(ValueError, gFunc.strf_to_datetime, "20231227")
+        self.assertRaises(ValueError, gFunc.strf_to_datetime, "2023132710")
+
     def test_int_def(self):
         self.assertEqual(-1, gFunc.int_def("Hallo", -1))
         self.assertEqual(200, gFunc.int_def("200", -1))
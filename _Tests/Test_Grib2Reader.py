@@ -1,9 +1,13 @@
 import os
+import tempfile
 import unittest
 import _Tests.testConsts as tc
 import numpy as np
+import pandas as pd
 from datetime import datetime
-from Lib.Grib2Reader import Grib2Datas
+from types import SimpleNamespace
+from unittest.mock import patch
+from Lib.Grib2Reader import Grib2Datas, _read_grid, _make_grid_getter, _round_significant, _UNDEFINED_VALUE
 from Lib.IOConsts import *
 
 
@@ -181,3 +185,77 @@ class TestGrib2Reader(unittest.TestCase):
                                  [(54.4, 11.2), (53.4, 12.2)],
                                  0.04)
         self.assertEqual(98.97459998987652, df5["TCDC"].iloc[0])
+
+    @patch("Lib.Grib2Reader.subprocess.run")
+    def test_read_grid(self, mock_run):
+        def write_bin(values, returncode=0):
+            # wgrib2 writes the values into the file of the option '-bin' (last argument)
+            def run(command, **kwargs):
+                np.array(values, dtype="<f4").tofile(command[-1])
+                return SimpleNamespace(returncode=returncode, stdout="", stderr="error")
+            return run
+
+        # valid grid - 2 latitudes x 3 longitudes, ordered west to east and south to north
+        mock_run.side_effect = write_bin([1, 2, 3, 4, 5, 9.999e+20])
+        grid = _read_grid("file with spaces.grib2", "TCDC", 2, 3)
+        self.assertEqual((2, 3), grid.shape)
+        self.assertEqual(5, grid[1, 1])
+        self.assertEqual(_UNDEFINED_VALUE, grid[1, 2])
+        # the file name is passed as one argument
+        self.assertIn("file with spaces.grib2", mock_run.call_args[0][0])
+
+        # number of values does not fit the grid
+        mock_run.side_effect = write_bin([1, 2, 3, 4, 5])
+        with self.assertWarns(UserWarning):
+            grid = _read_grid("file.grib2", "TCDC", 2, 3)
+        self.assertEqual((2, 3), grid.shape)
+        self.assertTrue(np.isnan(grid).all())
+
+        # wgrib2 failed
+        mock_run.side_effect = write_bin([], returncode=8)
+        with self.assertWarns(UserWarning):
+            grid = _read_grid("file.grib2", "TCDC", 2, 3)
+        self.assertTrue(np.isnan(grid).all())
+
+    def test_make_grid_getter(self):
+        grid = np.array([[1, 2, 3], [4, 5, 6]], dtype=float)
+        # latitude 50 to 51, longitude 10 to 12 with 1 degree
+        get_values = _make_grid_getter(grid, 50, 10, 1)
+        values = get_values(np.array([[51, 12], [50.4, 10.6], [49, 10], [50, 13]]))
+        self.assertEqual(6, values[0])
+        self.assertEqual(2, values[1])
+        # outside the grid
+        self.assertEqual(_UNDEFINED_VALUE, values[2])
+        self.assertEqual(_UNDEFINED_VALUE, values[3])
+        # grid of a file that could not be decoded
+        get_values = _make_grid_getter(np.full((2, 3), np.nan), 50, 10, 1)
+        self.assertTrue(np.isnan(get_values(np.array([[51, 12]]))).all())
+
+    def test_round_significant(self):
+        values = np.array([87.50000762939453, 0.0, -3.1415926, 123456789.0, 1.23456789e-5], dtype=np.float32)
+        expected = [float(f"{value:g}") for value in values]
+        self.assertEqual(expected, _round_significant(values.astype(float), 6).tolist())
+
+    @patch("Lib.Grib2Reader._read_grid")
+    def test_get_grid_values_replaced_file(self, mock_read_grid):
+        grib2_datas = Grib2Datas()
+        grib2_datas.df_models = pd.DataFrame({COL_MODEL: ["icon-d2"], COL_PARAM: ["TCDC"],
+                                              COL_MODEL_LAT_START: [50.0], COL_MODEL_LAT_END: [51.0],
+                                              COL_MODEL_LON_START: [10.0], COL_MODEL_LON_END: [12.0],
+                                              COL_MODEL_LATLON_DELTA: [1.0]})
+        coords = np.array([[50.0, 10.0]])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "file.grib2")
+            with open(filename, "wb") as content:
+                content.write(b"1")
+            mock_read_grid.return_value = np.full((2, 3), 1.0)
+            self.assertEqual(1, grib2_datas._get_grid_values("icon-d2", "TCDC", filename, coords)[0])
+            # the decoded grid is used again
+            self.assertEqual(1, grib2_datas._get_grid_values("icon-d2", "TCDC", filename, coords)[0])
+            self.assertEqual(1, mock_read_grid.call_count)
+            # the file was replaced - the grid is decoded again
+            with open(filename, "wb") as content:
+                content.write(b"22")
+            mock_read_grid.return_value = np.full((2, 3), 2.0)
+            self.assertEqual(2, grib2_datas._get_grid_values("icon-d2", "TCDC", filename, coords)[0])
+            self.assertEqual(2, mock_read_grid.call_count)
@@ -1,5 +1,6 @@
 import unittest
 import os
+import tempfile
 import _Tests.testConsts as tc
 from unittest.mock import patch, mock_open
 from Lib.HtmlGrabbler import get_html_links_as_list, download_data, DownloadData
@@ -30,14 +31,36 @@ class TestHtmlGrabbler(unittest.TestCase):
         self.assertEqual([], links)
 
     @patch("requests.get")
+    @patch("os.replace")
     @patch("builtins.open", new_callable=mock_open)
-    def test_download_data(self, mock_file, mock_get):
+    def test_download_data(self, mock_file, mock_replace, mock_get):
         # Mocking the response of requests.get
         mock_get.return_value.status_code = 200
         mock_get.return_value.content = b'file content'
         download_data([DownloadData(url="http://example.com/file.txt", file="file.txt", path=tc.TEST_DOWNLOAD_DIR)])
-        mock_file.assert_called_with(f"{tc.TEST_DOWNLOAD_DIR}\\file.txt", 'wb')
+        # the content is written to a temporary file, which is renamed after the complete content was written
+        mock_file.assert_called_with(f"{tc.TEST_DOWNLOAD_DIR}\\file.txt.part", 'wb')
         mock_file().write.assert_called_with(b'file content')
+        mock_replace.assert_called_with(f"{tc.TEST_DOWNLOAD_DIR}\\file.txt.part", f"{tc.TEST_DOWNLOAD_DIR}\\file.txt")
+
+    @patch("requests.get")
+    def test_existing_download_data(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.content = b'file content'
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # complete file exist - no download
+            with open(os.path.join(tmp_dir, "file.txt"), "wb") as content:
+                content.write(b'old content')
+            download_data([DownloadData(url="http://example.com/file.txt", file="file.txt", path=tmp_dir)])
+            mock_get.assert_not_called()
+            # only the temporary file of an interrupted download exist - download again
+            with open(os.path.join(tmp_dir, "file2.txt.part"), "wb") as content:
+                content.write(b'file')
+            download_data([DownloadData(url="http://example.com/file2.txt", file="file2.txt", path=tmp_dir)])
+            mock_get.assert_called_once()
+            with open(os.path.join(tmp_dir, "file2.txt"), "rb") as content:
+                self.assertEqual(b'file content', content.read())
+            self.assertFalse(os.path.exists(os.path.join(tmp_dir, "file2.txt.part")))
 
     def test_empty_download_data(self):
         empty_download_obj = DownloadData("", "", "")